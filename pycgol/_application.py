@@ -1,8 +1,19 @@
+import os
+
 import pygame
 import pygame_gui
 
 from .ui._ui import UI
-from .engines import Engine, EngineRegistry, LoopEngine, NumpyEngine, SparseEngine
+from .engines import (
+    CudaEngine,
+    Engine,
+    EngineRegistry,
+    LoopEngine,
+    NumbaEngine,
+    NumpyEngine,
+    PackedEngine,
+    SparseEngine,
+)
 from .application import EventHandler, GameLoop, WorldInitializer
 
 _SCREEN_WIDTH: int = 1280
@@ -15,7 +26,7 @@ class Application:
     def __init__(
         self,
         gol_updates_per_second: int = 10,
-        engine: type[Engine] = NumpyEngine,
+        engine: type[Engine] | None = None,
         engine_registry: EngineRegistry | None = None,
         world_initializer: WorldInitializer | None = None,
         game_loop: GameLoop | None = None,
@@ -26,7 +37,9 @@ class Application:
 
         Args:
             gol_updates_per_second: Number of game state updates per second
-            engine: Initial engine class to use
+            engine: Initial engine class to use. When omitted, the engine
+                named by the PYCGOL_BACKEND environment variable is used if
+                it is in the default registry, else NumpyEngine
             engine_registry: Optional custom engine registry
             world_initializer: Optional custom world initializer
             game_loop: Optional custom game loop
@@ -79,9 +92,28 @@ class Application:
             self._engine_registry.register("numpy", NumpyEngine, is_default=True)
             self._engine_registry.register("loop", LoopEngine)
             self._engine_registry.register("sparse", SparseEngine)
+            self._engine_registry.register("packed", PackedEngine)
+            # Uncompiled, the numba kernel is slower than the loop engine
+            if NumbaEngine.jit_compiled:
+                self._engine_registry.register("numba", NumbaEngine)
+            if CudaEngine.gpu_available():
+                self._engine_registry.register("cuda", CudaEngine)
         else:
             self._engine_registry = engine_registry
 
+        # Without an explicit engine or registry, PYCGOL_BACKEND selects the
+        # starting engine by name; names that are not registered (e.g. "cuda"
+        # without a GPU) are ignored
+        if engine is None:
+            engine = NumpyEngine
+            backend = os.environ.get("PYCGOL_BACKEND")
+            if (
+                engine_registry is None
+                and backend is not None
+                and self._engine_registry.is_registered(backend)
+            ):
+                engine = self._engine_registry.get(backend)
+
         # Set current engine (for backward compatibility with direct engine parameter)
         self._engine = engine
 
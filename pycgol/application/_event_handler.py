@@ -154,7 +154,7 @@ class EventHandler:
             self._ui.hide_context_menu()
         # Check if it's the help button
         elif self._ui.is_help_button(event.ui_element):
-            self._ui.show_help_popup()
+            self._ui.show_help_popup(self._available_engines)
 
     def _handle_window_close(self) -> None:
         """Handle window close events."""
@@ -17,6 +17,9 @@ class GameLoop:
         self._update_interval = 1.0 / updates_per_second
         self._time_since_last_update = 0.0
         self._paused = False
+        # Previous generation, handed back to the engine as the buffer for
+        # the next one so steady-state updates do not allocate
+        self._spare: State | None = None
 
     @property
     def is_paused(self) -> bool:
@@ -46,6 +49,11 @@ class GameLoop:
 
         Returns:
             Updated state (may be the same object if not updated)
+
+        Note:
+            When the state advances, the state passed in is kept and may be
+            overwritten by a later update, so callers should only hold on to
+            the returned state.
         """
         if self._paused:
             return state
@@ -53,7 +61,9 @@ class GameLoop:
         self._time_since_last_update += delta_t
 
         if self._time_since_last_update >= self._update_interval:
-            state = engine.next_state(state)
+            next_state = engine.next_state_into(state, self._spare)
+            self._spare = state if next_state is not state else None
+            state = next_state
             self._time_since_last_update = 0.0
 
         return state
@@ -1,7 +1,10 @@
 from ._engine import Engine
+from ._cuda_engine import CudaEngine
 from ._loop_engine import LoopEngine
+from ._numba_engine import NumbaEngine
 from ._numpy_engine import NumpyEngine
+from ._packed_engine import PackedEngine
 from ._sparse_engine import SparseEngine
 from ._engine_registry import EngineRegistry
 
-__all__ = ["Engine", "LoopEngine", "NumpyEngine", "SparseEngine", "EngineRegistry"]
+__all__ = ["Engine", "CudaEngine", "LoopEngine", "NumbaEngine", "NumpyEngine", "PackedEngine", "SparseEngine", "EngineRegistry"]
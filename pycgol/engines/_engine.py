@@ -8,7 +8,7 @@ Conway's Game of Life Rules:
 """
 
 from abc import ABC, abstractmethod
-from ..state import State
+from ..state import State, DenseState
 
 
 class Engine(ABC):
@@ -36,6 +36,44 @@ class Engine(ABC):
         """
         pass
 
+    @classmethod
+    def next_state_into(cls, state: State, out: State | None) -> State:
+        """
+        Calculate the next generation, writing into out where possible.
+
+        Engines that can fill an existing buffer override this to reuse out
+        instead of allocating a new state each generation. The default just
+        calls next_state and ignores out.
+
+        Args:
+            state: Current state (any StateInterface implementation)
+            out: Spare state that may be overwritten with the result, or None
+
+        Returns:
+            State for the next generation: out if it was reused, else a new state
+        """
+        return cls.next_state(state)
+
+    @staticmethod
+    def _dense_output(state: DenseState, out: State | None) -> DenseState:
+        """
+        Pick the dense state to write the next generation into.
+
+        Args:
+            state: Current dense state, which is never overwritten
+            out: Spare state offered by the caller, or None
+
+        Returns:
+            out if it is a distinct DenseState of the same size, else a new one
+        """
+        if (
+            isinstance(out, DenseState)
+            and out is not state
+            and out._grid.shape == state._grid.shape
+        ):
+            return out
+        return DenseState(state.width, state.height)
+
     @classmethod
     def optimize_state(cls, state: State) -> State:
         """
@@ -1,5 +1,12 @@
+from functools import lru_cache
+
 from ._engine import Engine
-from ..state import State
+from ..state import State, DenseState
+
+# (dx, dy) offsets of the 8 neighbours of a cell
+_NEIGHBOUR_OFFSETS = tuple(
+    (dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dx, dy) != (0, 0)
+)
 
 
 class LoopEngine(Engine):
@@ -13,31 +20,35 @@ class LoopEngine(Engine):
     preferred_state_type = None
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _neighbours(
         cls, cell: tuple[int, int], width: int, height: int
-    ) -> list[tuple[int, int]]:
+    ) -> tuple[tuple[int, int], ...]:
+        # A pure function of its arguments, so each cell's neighbours are
+        # computed once per grid size and reused every generation
         x, y = cell
 
         if x < 0 or x >= width or y < 0 or y >= height:
             raise ValueError(f"({x}, {y}) is outside of the bounds ({width}, {height})")
 
-        retval = [
-            (x - 1, y - 1),
-            (x, y - 1),
-            (x + 1, y - 1),
-            (x - 1, y),
-            (x + 1, y),
-            (x - 1, y + 1),
-            (x, y + 1),
-            (x + 1, y + 1),
-        ]
-        return [(x, y) for (x, y) in retval if 0 <= x < width and 0 <= y < height]
+        return tuple(
+            (x + dx, y + dy)
+            for dx, dy in _NEIGHBOUR_OFFSETS
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        )
 
     @classmethod
     def _alive_neighbours(cls, cell: tuple[int, int], state: State) -> int:
+        x, y = cell
+        if isinstance(state, DenseState) and 0 <= x < state.width and 0 <= y < state.height:
+            # Sum the clipped 3x3 window in one numpy call rather than
+            # reading up to eight cells through __getitem__
+            grid = state._grid
+            window = grid[max(0, y - 1):y + 2, max(0, x - 1):x + 2]
+            return int(window.sum()) - int(grid[y, x])
+
         neighbours = cls._neighbours(cell, state.width, state.height)
-        alive_neighbours = [state[x, y] for x, y in neighbours]
-        return sum(alive_neighbours)
+        return sum(state[x, y] for x, y in neighbours)
 
     @classmethod
     def _next_cell_state(cls, cell: tuple[int, int], state: State) -> bool:
@@ -0,0 +1,97 @@
+"""JIT-compiled engine implementation for Game of Life."""
+
+from ._engine import Engine
+from ..state import State, DenseState
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional: fall back to running the kernel as plain Python
+    _NUMBA_AVAILABLE = False
+
+    # Replaces the numba decorator under the same name, so the kernels below
+    # are declared identically either way
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range  # type: ignore[misc]  # numba.prange is typed as a class
+else:
+    _NUMBA_AVAILABLE = True
+
+
+# Below this many cells the thread fork/join cost outweighs the parallel speed-up
+_PARALLEL_THRESHOLD = 64 * 64
+
+
+@njit(cache=True, boundscheck=False)
+def _step_row(grid, out, y):
+    """Write row y of the next generation of grid into out."""
+    height, width = grid.shape
+    top = max(0, y - 1)
+    bottom = min(height, y + 2)
+    for x in range(width):
+        left = max(0, x - 1)
+        right = min(width, x + 2)
+
+        count = 0
+        for ny in range(top, bottom):
+            for nx in range(left, right):
+                count += grid[ny, nx]
+
+        alive = grid[y, x]
+        count -= alive
+        out[y, x] = 1 if count == 3 or (alive and count == 2) else 0
+
+
+@njit(cache=True, boundscheck=False)
+def _step(grid, out):
+    """Write the next generation of grid into out in one fused pass."""
+    for y in range(grid.shape[0]):
+        _step_row(grid, out, y)
+
+
+@njit(cache=True, boundscheck=False, parallel=True)
+def _step_parallel(grid, out):
+    """Like _step, but with rows split across threads.
+
+    Each row only writes to its own row of out, so the bands are independent.
+    """
+    for y in prange(grid.shape[0]):
+        _step_row(grid, out, y)
+
+
+class NumbaEngine(Engine):
+    """Numba-compiled nested loop implementation.
+
+    Reads each cell's 3x3 neighbourhood and applies the rules in a single
+    native loop, with no temporary arrays. The kernel is compiled on first
+    use (and cached on disk); without numba installed it runs as plain
+    Python, which is correct but slow. Grids of 64x64 cells or more are
+    split into row bands computed on all available cores.
+    """
+
+    # Prefer dense state so the kernel can work on the uint8 grid directly
+    preferred_state_type = DenseState
+
+    # Whether the kernel is actually JIT-compiled
+    jit_compiled: bool = _NUMBA_AVAILABLE
+
+    @classmethod
+    def next_state(cls, state: State) -> State:
+        """Calculate next generation with the compiled kernel."""
+        return cls.next_state_into(state, None)
+
+    @classmethod
+    def next_state_into(cls, state: State, out: State | None) -> State:
+        """Calculate next generation with the compiled kernel, reusing out."""
+        # Optimize to dense state if needed
+        state = cls.optimize_state(state)
+        assert isinstance(state, DenseState)
+
+        next_state = cls._dense_output(state, out)
+        step = _step_parallel if state.width * state.height >= _PARALLEL_THRESHOLD else _step
+        step(state._grid, next_state._grid)
+
+        return next_state
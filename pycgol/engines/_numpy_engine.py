@@ -1,10 +1,50 @@
+from collections.abc import Callable
+from functools import lru_cache
+
 import numpy as np
-from scipy import signal
 
 from ._engine import Engine
 from ..state import State, DenseState
 
 
+@lru_cache(maxsize=32)
+def _kernel_for(width: int, height: int) -> Callable[[np.ndarray, np.ndarray], None]:
+    """
+    Build a next-generation kernel specialised for a fixed grid size.
+
+    The zero-padded scratch grid and the eight neighbour views into it are
+    created once per size, so each call only copies the input in and runs
+    the vectorised rule.
+
+    Args:
+        width: Width of the grid
+        height: Height of the grid
+
+    Returns:
+        Function step(grid_out, grid_in) writing the next generation of the
+        (height, width) uint8 grid_in into grid_out
+    """
+    padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    centre = padded[1:-1, 1:-1]
+    neighbours = [
+        padded[dy:dy + height, dx:dx + width]
+        for dy in range(3)
+        for dx in range(3)
+        if (dx, dy) != (1, 1)
+    ]
+    count = np.empty((height, width), dtype=np.uint8)
+
+    def step(grid_out: np.ndarray, grid_in: np.ndarray) -> None:
+        centre[...] = grid_in
+        np.copyto(count, neighbours[0])
+        for view in neighbours[1:]:
+            np.add(count, view, out=count)
+        # Dead cells with 3 neighbours are born, live cells with 2 or 3 survive
+        np.logical_or(count == 3, centre & (count == 2), out=grid_out)
+
+    return step
+
+
 class NumpyEngine(Engine):
     """Numpy-optimized implementation.
 
@@ -15,37 +55,19 @@ class NumpyEngine(Engine):
     # Prefer dense state for numpy array operations
     preferred_state_type = DenseState
 
-    # Convolution kernel to count neighbors
-    _KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.int8)
-
     @classmethod
     def next_state(cls, state: State) -> State:
+        return cls.next_state_into(state, None)
+
+    @classmethod
+    def next_state_into(cls, state: State, out: State | None) -> State:
         # Optimize to dense state if needed
         state = cls.optimize_state(state)
+        assert isinstance(state, DenseState)
 
-        # Now we can safely assume it's a DenseState with _cells attribute
-        # Convert state to numpy array for fast computation
-        grid = np.array(
-            [[state[x, y] for x in range(state.width)] for y in range(state.height)],
-            dtype=np.int8,
-        )
-
-        # Count neighbors using convolution (much faster than loops)
-        neighbor_count = signal.convolve2d(
-            grid, cls._KERNEL, mode="same", boundary="fill"
-        )
-
-        # Apply Game of Life rules vectorized
-        # Live cells with 2 or 3 neighbors survive
-        # Dead cells with exactly 3 neighbors become alive
-        next_grid = ((grid == 1) & ((neighbor_count == 2) | (neighbor_count == 3))) | (
-            (grid == 0) & (neighbor_count == 3)
-        )
-
-        # Create new dense state and copy results
-        next_state = DenseState(state.width, state.height)
-        for y in range(state.height):
-            for x in range(state.width):
-                next_state[x, y] = bool(next_grid[y, x])
+        # Now we can safely assume it's a DenseState backed by a uint8 grid,
+        # so the kernel reads it and writes the next generation in place
+        next_state = cls._dense_output(state, out)
+        _kernel_for(state.width, state.height)(next_state._grid, state._grid)
 
         return next_state
@@ -1,10 +1,15 @@
 from abc import ABC
-from ..state import State
+
+import numpy as np
+
+from ..state import State, DenseState
 
 
 class Object(ABC):
     """Base class for Game of Life objects with rotation and placement support."""
 
+    _ROTATIONS = (0, 90, 180, 270)
+
     def __init__(self, cells: list[tuple[int, int]]) -> None:
         """
         Initialize a Game of Life object.
@@ -13,6 +18,12 @@ class Object(ABC):
             cells: List of (x, y) coordinates defining the object's pattern
         """
         self._cells = cells
+        # The pattern never changes, so rotate it once per angle up front and
+        # let place() look the result up instead of rotating on every call
+        self._rotated_cells = {
+            rotation: np.asarray(self._apply_rotation(rotation), dtype=np.int64)
+            for rotation in self._ROTATIONS
+        }
 
     @staticmethod
     def _rotate_90_cw(x: int, y: int, width: int, height: int) -> tuple[int, int]:
@@ -97,12 +108,27 @@ class Object(ABC):
 
         Returns:
             The modified state object (same object, not a copy)
+
+        Raises:
+            ValueError: If rotation is not 0, 90, 180 or 270
         """
         x, y = position
-        cells = self._apply_rotation(rotation)
+        cells = self._rotated_cells.get(rotation)
+        if cells is None:
+            raise ValueError(
+                f"Invalid rotation: {rotation}. Must be 0, 90, 180, or 270."
+            )
 
-        for u, v in cells:
-            if 0 <= x + u < state.width and 0 <= y + v < state.height:
-                state[x + u, y + v] = True
+        xs = cells[:, 0] + x
+        ys = cells[:, 1] + y
+        inside = (xs >= 0) & (xs < state.width) & (ys >= 0) & (ys < state.height)
+        xs, ys = xs[inside], ys[inside]
+
+        if isinstance(state, DenseState):
+            # One vectorised store instead of a bounds-checked write per cell
+            state._grid[ys, xs] = 1
+        else:
+            for u, v in zip(xs.tolist(), ys.tolist()):
+                state[u, v] = True
 
         return state
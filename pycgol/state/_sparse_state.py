@@ -1,19 +1,27 @@
 """Sparse state storage implementation."""
 
+import numpy as np
+
 from ._state import State
+from ._dense_state import DenseState
+
+_INITIAL_CAPACITY = 16
 
 
 class SparseState(State):
-    """Sparse storage using set of live cell coordinates.
+    """Sparse storage using a sorted array of live cell indices.
 
-    Only stores coordinates of live cells, making it memory-efficient for
-    sparse patterns. Dead cells are implicitly represented by absence.
+    Only stores the flat indices (y * width + x) of live cells, kept sorted
+    in a growable int64 buffer, making it memory-efficient for sparse
+    patterns. Dead cells are implicitly represented by absence.
 
-    Memory: O(live cells)
-    Access: O(1) with hash lookup
+    Memory: O(live cells), 8 bytes each
+    Access: O(log live cells) with binary search
     Best for: Sparse patterns (<10% alive cells)
     """
 
+    __slots__ = ("_width", "_height", "_buffer", "_count")
+
     def __init__(self, width: int, height: int):
         """
         Initialize a sparse state grid.
@@ -32,7 +40,9 @@ class SparseState(State):
 
         self._width = width
         self._height = height
-        self._live_cells: set[tuple[int, int]] = set()
+        # Live cell indices occupy the first _count slots of _buffer
+        self._buffer = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._count = 0
 
     @property
     def width(self) -> int:
@@ -44,6 +54,32 @@ class SparseState(State):
         """Height of the game grid."""
         return self._height
 
+    @property
+    def _indices(self) -> np.ndarray:
+        """Sorted flat indices of the live cells (a view, not a copy)."""
+        return self._buffer[: self._count]
+
+    @classmethod
+    def _from_indices(
+        cls, width: int, height: int, indices: np.ndarray
+    ) -> "SparseState":
+        """
+        Create a sparse state directly from flat live cell indices.
+
+        Args:
+            width: Width of the grid
+            height: Height of the grid
+            indices: Sorted, unique flat indices (y * width + x) of live cells
+
+        Returns:
+            New SparseState using indices as its storage (not a copy)
+        """
+        new_state = cls(width, height)
+        if len(indices):
+            new_state._buffer = np.asarray(indices, dtype=np.int64)
+            new_state._count = len(indices)
+        return new_state
+
     def _validate_bounds(self, index: tuple[int, int]) -> None:
         """Validate that coordinates are within grid bounds."""
         x, y = index
@@ -56,33 +92,87 @@ class SparseState(State):
         """
         Get cell state at position (x, y).
 
-        Complexity: O(1) average case (hash lookup)
+        Complexity: O(log live cells) (binary search)
         """
         self._validate_bounds(index)
-        return index in self._live_cells
+        x, y = index
+        flat = y * self._width + x
+        pos = int(np.searchsorted(self._indices, flat))
+        return pos < self._count and int(self._buffer[pos]) == flat
 
     def __setitem__(self, index: tuple[int, int], value: bool) -> None:
         """
         Set cell state at position (x, y).
 
-        Complexity: O(1) average case (hash set operations)
+        Complexity: O(live cells) to shift the tail of the sorted buffer,
+        with the buffer doubling in size when it fills up
         """
         self._validate_bounds(index)
-        if value:
-            self._live_cells.add(index)
-        else:
-            self._live_cells.discard(index)
+        x, y = index
+        flat = y * self._width + x
+        count = self._count
+        pos = int(np.searchsorted(self._indices, flat))
+        present = pos < count and int(self._buffer[pos]) == flat
+
+        if value and not present:
+            if count == len(self._buffer):
+                grown = np.empty(2 * len(self._buffer), dtype=np.int64)
+                grown[:count] = self._buffer[:count]
+                self._buffer = grown
+            self._buffer[pos + 1 : count + 1] = self._buffer[pos:count]
+            self._buffer[pos] = flat
+            self._count = count + 1
+        elif not value and present:
+            self._buffer[pos : count - 1] = self._buffer[pos + 1 : count]
+            self._count = count - 1
 
     def get_live_cells(self) -> set[tuple[int, int]]:
         """
         Get set of all live cell coordinates.
 
-        This is O(1) for sparse state since we already store the set.
+        Decodes the stored indices in one vectorized pass.
 
         Returns:
-            Copy of the set of (x, y) tuples for all live cells
+            New set of (x, y) tuples for all live cells
         """
-        return self._live_cells.copy()
+        ys, xs = np.divmod(self._indices, self._width)
+        return set(zip(xs.tolist(), ys.tolist()))
+
+    def live_cells_in_rect(
+        self, x0: int, y0: int, x1: int, y1: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the coordinates of the live cells inside a rectangle of the grid.
+
+        Within each row y the sorted indices of the rectangle's cells form
+        one contiguous run, from y * width + x0 to y * width + x1. Binary
+        searches find every row's run at once, so only live cells actually
+        inside the rectangle are decoded, however many lie beside it. The
+        rectangle is clipped to the grid first, since a run reaching past
+        either side of a row would spill into the neighbouring row.
+        Complexity: O(rows * log live cells + live cells in the rectangle)
+
+        Args:
+            x0: Left edge of the rectangle (inclusive)
+            y0: Top edge of the rectangle (inclusive)
+            x1: Right edge of the rectangle (exclusive)
+            y1: Bottom edge of the rectangle (exclusive)
+
+        Returns:
+            Arrays (xs, ys) of the coordinates of the live cells
+        """
+        x0, y0, x1, y1 = self._clip_rect(x0, y0, x1, y1)
+        indices = self._indices
+        row_starts = np.arange(y0, y1, dtype=np.int64) * self._width
+        starts = np.searchsorted(indices, row_starts + x0)
+        lengths = np.searchsorted(indices, row_starts + x1) - starts
+
+        # Concatenate the runs: position i of run r is starts[r] + i
+        run_offsets = np.cumsum(lengths) - lengths
+        total = int(lengths.sum())
+        take = np.arange(total) + np.repeat(starts - run_offsets, lengths)
+        ys, xs = np.divmod(indices[take], self._width)
+        return xs, ys
 
     @classmethod
     def from_state(cls, other: State) -> "SparseState":
@@ -95,17 +185,51 @@ class SparseState(State):
         Returns:
             New SparseState with same dimensions and live cells
         """
-        new_state = cls(other.width, other.height)
+        if isinstance(other, DenseState):
+            return cls.from_dense(other)
+        if isinstance(other, SparseState):
+            return cls._from_indices(other.width, other.height, other._indices.copy())
 
         # Efficient conversion: only copy live cells
         if hasattr(other, "get_live_cells"):
-            for x, y in other.get_live_cells():
-                new_state[x, y] = True
+            live_cells = other.get_live_cells()
         else:
             # Fallback: scan entire grid (slow for dense states)
-            for y in range(other.height):
-                for x in range(other.width):
-                    if other[x, y]:
-                        new_state[x, y] = True
+            live_cells = {
+                (x, y)
+                for y in range(other.height)
+                for x in range(other.width)
+                if other[x, y]
+            }
+
+        indices = np.array(
+            sorted(y * other.width + x for x, y in live_cells), dtype=np.int64
+        )
+        return cls._from_indices(other.width, other.height, indices)
 
-        return new_state
+    @classmethod
+    def from_dense(cls, dense: DenseState) -> "SparseState":
+        """
+        Create sparse state from a dense state in a single vectorized scan.
+
+        Args:
+            dense: Source dense state to convert from
+
+        Returns:
+            New SparseState with same dimensions and live cells
+        """
+        # Row-major flat indices of the grid are already y * width + x, sorted
+        return cls._from_indices(
+            dense.width, dense.height, np.flatnonzero(dense._grid)
+        )
+
+    def to_dense(self) -> DenseState:
+        """
+        Create a dense state with the same dimensions and live cells.
+
+        Returns:
+            New DenseState populated with a single scatter of the live cells
+        """
+        dense = DenseState(self._width, self._height)
+        dense._grid.ravel()[self._indices] = 1
+        return dense
@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class State(ABC):
     """Abstract base class for Game of Life state storage.
@@ -10,6 +12,9 @@ class State(ABC):
     while maintaining a consistent API for engines and rendering.
     """
 
+    # Empty so that subclasses declaring __slots__ carry no instance __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def width(self) -> int:
@@ -65,6 +70,39 @@ class State(ABC):
         """
         pass
 
+    def live_cells_in_rect(
+        self, x0: int, y0: int, x1: int, y1: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the coordinates of the live cells inside a rectangle of the grid.
+
+        Used by rendering to look only at the cells on screen. This default
+        filters get_live_cells(); subclasses override it to search their own
+        storage. The rectangle may extend past the grid: only the part that
+        overlaps it is searched.
+
+        Args:
+            x0: Left edge of the rectangle (inclusive)
+            y0: Top edge of the rectangle (inclusive)
+            x1: Right edge of the rectangle (exclusive)
+            y1: Bottom edge of the rectangle (exclusive)
+
+        Returns:
+            Arrays (xs, ys) of the coordinates of the live cells
+        """
+        cells = np.array(list(self.get_live_cells()), dtype=np.int64).reshape(-1, 2)
+        xs, ys = cells[:, 0], cells[:, 1]
+        inside = (xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)
+        return xs[inside], ys[inside]
+
+    def _clip_rect(
+        self, x0: int, y0: int, x1: int, y1: int
+    ) -> tuple[int, int, int, int]:
+        """Clip an end-exclusive rectangle to the grid, never inverting it."""
+        x0 = min(max(x0, 0), self.width)
+        y0 = min(max(y0, 0), self.height)
+        return x0, y0, min(max(x1, x0), self.width), min(max(y1, y0), self.height)
+
     @classmethod
     @abstractmethod
     def from_state(cls, other: "State") -> "State":
@@ -81,16 +119,3 @@ class State(ABC):
             New state of this type with same dimensions and live cells
         """
         pass
-
-    @abstractmethod
-    def _validate_bounds(self, index: tuple[int, int]) -> None:
-        """
-        Validate that coordinates are within grid bounds.
-
-        Args:
-            index: Tuple of (x, y) coordinates
-
-        Raises:
-            ValueError: If coordinates are out of bounds
-        """
-        pass
@@ -1,11 +1,64 @@
 """Rendering of Game of Life state to the screen."""
 
+import numpy as np
 import pygame
 import pygame_gui
 
-from ..state import State
+from ..state import State, DenseState
 from ._viewport_manager import ViewportManager
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to the NumPy path
+    _NUMBA_AVAILABLE = False
+else:
+    _NUMBA_AVAILABLE = True
+
+# Colors, parsed into pygame.Color once rather than on every fill
+_BACKGROUND_COLOR = pygame.Color(20, 30, 60)  # dark blue, outside the grid
+_DEAD_COLOR = pygame.Color("black")
+_ALIVE_COLOR = pygame.Color("white")
+_FPS_COLOR = pygame.Color(0, 255, 0)
+# RGB for dead (0) and alive (1) cells, indexed by the grid's values
+_CELL_PALETTE = np.array([_DEAD_COLOR[:3], _ALIVE_COLOR[:3]], dtype=np.uint8)
+
+# Past this many dirty rects, pushing their single bounding rect is cheaper
+# than having SDL update each one
+_MAX_DIRTY_RECTS = 64
+
+# Most distinct FPS counter strings kept rendered at once
+_FPS_CACHE_SIZE = 256
+
+# Largest cell size at which dense grids are drawn by writing pixels directly;
+# above it there are few enough cells on screen for per-cell blits to win
+_PIXEL_PATH_MAX_CELL_SIZE = 8
+
+
+def _dense_cell_positions(grid, x0, y0, x1, y1, viewport_x, viewport_y, cell_size):
+    """Screen positions of the live cells in grid[y0:y1, x0:x1], as an (N, 2) array.
+
+    Scans the rectangle twice, once to count and once to fill, so the result
+    is built in a single allocation without NumPy's intermediate arrays.
+    """
+    count = 0
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            count += grid[y, x]
+
+    positions = np.empty((count, 2), dtype=np.int64)
+    i = 0
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            if grid[y, x]:
+                positions[i, 0] = (x - viewport_x) * cell_size
+                positions[i, 1] = (y - viewport_y) * cell_size
+                i += 1
+    return positions
+
+
+if _NUMBA_AVAILABLE:
+    _dense_cell_positions = njit(cache=True, boundscheck=False)(_dense_cell_positions)
+
 
 class Renderer:
     """Handles rendering of the game state and UI elements."""
@@ -20,69 +73,311 @@ class Renderer:
         """
         self._screen = screen
         self._manager = manager
+        # Screen size, queried once rather than every frame; the display
+        # is created with a fixed size and is never resized
+        self._screen_width = screen.get_width()
+        self._screen_height = screen.get_height()
+        # Solid white tile for one live cell, rebuilt when the cell size changes
+        self._cell_surface: pygame.Surface | None = None
+        self._cell_surface_size = 0
+        # FPS font, loaded on first use, and rendered text surfaces by string
+        self._font: pygame.font.Font | None = None
+        self._fps_cache: dict[str, pygame.Surface] = {}
+        # What was pushed to the display last frame, to work out what changed
+        self._last_view: tuple[int, ...] | None = None
+        # Grid rectangle on screen for the last view, see _clip_to_screen
+        self._visible_bounds: tuple[int, int, int, int] | None = None
+        self._last_cells: set[tuple[int, int]] = set()
+        self._last_pixels: np.ndarray | None = None
+        self._last_fps_label: str | None = None
+        self._last_fps_text: pygame.Surface | None = None
+        self._last_fps_rect: pygame.Rect | None = None
+        self._last_ui_rects: list[pygame.Rect] = []
+        # Rects reused from frame to frame for the in-bounds area and for
+        # dirty cells; the pool only ever grows
+        self._grid_rect = pygame.Rect(0, 0, 0, 0)
+        self._rect_pool: list[pygame.Rect] = []
 
-    def render(self, state: State, viewport: ViewportManager, fps: float = 0.0) -> None:
+    def _get_cell_surface(self, cell_size: int) -> pygame.Surface:
         """
-        Render the game state and UI.
+        Get a white surface the size of one cell.
 
         Args:
-            state: Current game state
+            cell_size: Size of a cell in pixels
+
+        Returns:
+            Cached cell_size x cell_size white surface
+        """
+        if self._cell_surface is None or self._cell_surface_size != cell_size:
+            self._cell_surface = pygame.Surface((cell_size, cell_size))
+            self._cell_surface.fill(_ALIVE_COLOR)
+            self._cell_surface_size = cell_size
+        return self._cell_surface
+
+    def _get_fps_surface(self, text: str) -> pygame.Surface:
+        """
+        Get the rendered FPS counter text.
+
+        Loading the font and rasterising text are slow, so the font is
+        loaded once and each distinct counter string is rendered once.
+
+        Args:
+            text: FPS counter string to display
+
+        Returns:
+            Surface with the FPS counter text
+        """
+        surface = self._fps_cache.get(text)
+        if surface is None:
+            if self._font is None:
+                self._font = pygame.font.SysFont("monospace", 24, bold=True)
+            if len(self._fps_cache) >= _FPS_CACHE_SIZE:
+                self._fps_cache.clear()
+            surface = self._font.render(text, True, _FPS_COLOR)
+            self._fps_cache[text] = surface
+        return surface
+
+    def _cell_rects(
+        self, positions: set[tuple[int, int]], cell_size: int
+    ) -> list[pygame.Rect]:
+        """
+        Get rectangles covering cells, reusing pooled Rect objects.
+
+        The returned rects are overwritten by the next call, so they must be
+        consumed (e.g. by pygame.display.update) before then.
+
+        Args:
+            positions: Screen positions of the top-left corners of the cells
+            cell_size: Size of a cell in pixels
+
+        Returns:
+            One cell_size x cell_size rect per position
+        """
+        pool = self._rect_pool
+        if len(pool) < len(positions):
+            pool.extend(pygame.Rect(0, 0, 0, 0) for _ in range(len(positions) - len(pool)))
+        for rect, (x, y) in zip(pool, positions):
+            rect.update(x, y, cell_size, cell_size)
+        return pool[: len(positions)]
+
+    def _blit_pixels(self, cells: np.ndarray, cell_size: int) -> None:
+        """
+        Draw a block of cells into the in-bounds area as raw pixels.
+
+        Each cell is scaled up to cell_size x cell_size white or black pixels
+        and the whole block is copied to the screen in one operation.
+
+        Args:
+            cells: (rows, columns) uint8 array of the visible cells
+            cell_size: Size of a cell in pixels
+        """
+        # surfarray indexes pixels [x, y], the grid is [y, x]
+        pixels = cells.T
+        if cell_size > 1:
+            pixels = pixels.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+        pygame.surfarray.blit_array(
+            self._screen.subsurface(self._grid_rect), _CELL_PALETTE[pixels]
+        )
+
+    def _ui_rects(self) -> list[pygame.Rect]:
+        """
+        Get the screen areas covered by UI elements.
+
+        Returns:
+            Rectangles of every UI element except the full-screen root container
+        """
+        root = self._manager.get_root_container()
+        return [
+            element.rect.copy()
+            for element in self._manager.get_sprite_group().sprites()
+            if element is not root
+        ]
+
+    def _cell_positions(
+        self, state: State, viewport: ViewportManager, bounds: tuple[int, int, int, int]
+    ) -> set[tuple[int, int]]:
+        """
+        Find the screen positions of the live cells inside a rectangle of the grid.
+
+        The Python-level work in render is then proportional to the live cells
+        on screen, not to the viewport area.
+
+        Args:
+            state: Game state to search
             viewport: Viewport manager for camera position and zoom
-            fps: Current frames per second
+            bounds: (x0, y0, x1, y1) grid rectangle, end-exclusive
+
+        Returns:
+            Top-left screen pixel of every live cell in the rectangle
         """
-        # Fill with dark blue for out-of-bounds area
-        self._screen.fill((20, 30, 60))
+        if _NUMBA_AVAILABLE and isinstance(state, DenseState):
+            # Scan and convert to screen space in one compiled loop
+            screen_positions = _dense_cell_positions(
+                state._grid,
+                *bounds,
+                viewport.viewport_x,
+                viewport.viewport_y,
+                viewport.cell_size,
+            )
+            screen_xs, screen_ys = screen_positions[:, 0], screen_positions[:, 1]
+        else:
+            xs, ys = state.live_cells_in_rect(*bounds)
+            screen_xs = (xs - viewport.viewport_x) * viewport.cell_size
+            screen_ys = (ys - viewport.viewport_y) * viewport.cell_size
 
-        # Fill the in-bounds area with black
-        # Calculate the screen-space rectangle that corresponds to the in-bounds grid area
+        return set(zip(screen_xs.tolist(), screen_ys.tolist()))
+
+    def _clip_to_screen(
+        self, state: State, viewport: ViewportManager
+    ) -> tuple[int, int, int, int] | None:
+        """
+        Work out which part of the grid is on screen.
+
+        Depends only on the view (position, cell size, screen and grid
+        size), so render calls it only when the view changes. Also moves
+        the in-bounds area rect to cover that part of the screen.
+
+        Args:
+            state: Current game state
+            viewport: Viewport manager for camera position and zoom
+
+        Returns:
+            (x0, y0, x1, y1) end-exclusive grid rectangle on screen, or None
+            if no part of the grid is on screen
+        """
+        # Calculate the screen-space rectangle that corresponds to the in-bounds grid area.
+        # Everything is clipped to this range up front, so cells off the
+        # grid or off the screen are never visited.
         viewport_start_x = max(0, -viewport.viewport_x)
         viewport_start_y = max(0, -viewport.viewport_y)
-        viewport_cells_width = self._screen.get_width() // viewport.cell_size
-        viewport_cells_height = self._screen.get_height() // viewport.cell_size
+        viewport_cells_width = self._screen_width // viewport.cell_size
+        viewport_cells_height = self._screen_height // viewport.cell_size
         viewport_end_x = min(viewport_cells_width, state.width - viewport.viewport_x)
         viewport_end_y = min(viewport_cells_height, state.height - viewport.viewport_y)
 
-        if viewport_end_x > viewport_start_x and viewport_end_y > viewport_start_y:
-            pygame.draw.rect(
-                self._screen,
-                "black",
-                pygame.Rect(
-                    viewport_start_x * viewport.cell_size,
-                    viewport_start_y * viewport.cell_size,
-                    (viewport_end_x - viewport_start_x) * viewport.cell_size,
-                    (viewport_end_y - viewport_start_y) * viewport.cell_size,
-                ),
-            )
+        if viewport_end_x <= viewport_start_x or viewport_end_y <= viewport_start_y:
+            return None
+
+        self._grid_rect.update(
+            viewport_start_x * viewport.cell_size,
+            viewport_start_y * viewport.cell_size,
+            (viewport_end_x - viewport_start_x) * viewport.cell_size,
+            (viewport_end_y - viewport_start_y) * viewport.cell_size,
+        )
+        return (
+            viewport.viewport_x + viewport_start_x,
+            viewport.viewport_y + viewport_start_y,
+            viewport.viewport_x + viewport_end_x,
+            viewport.viewport_y + viewport_end_y,
+        )
+
+    def render(self, state: State, viewport: ViewportManager, fps: float = 0.0) -> None:
+        """
+        Render the game state and UI.
+
+        Args:
+            state: Current game state
+            viewport: Viewport manager for camera position and zoom
+            fps: Current frames per second
+        """
+        # Small cells of a dense grid are written straight into the pixels
+        pixel_grid = (
+            state._grid
+            if isinstance(state, DenseState)
+            and viewport.cell_size <= _PIXEL_PATH_MAX_CELL_SIZE
+            else None
+        )
+        pixel_path = pixel_grid is not None
+        # Everything that decides what is on screen, other than the cells
+        view = (
+            viewport.viewport_x,
+            viewport.viewport_y,
+            viewport.cell_size,
+            self._screen_width,
+            self._screen_height,
+            state.width,
+            state.height,
+            pixel_path,
+        )
+        if view != self._last_view:
+            self._visible_bounds = self._clip_to_screen(state, viewport)
+        bounds = self._visible_bounds
+
+        positions: set[tuple[int, int]] = set()
+        pixels_changed = False
+
+        # The fills and pixel writes share one lock of the screen rather
+        # than each locking it in turn. Blits fail on a locked surface, so
+        # it is unlocked again before any of those.
+        self._screen.lock()
+        try:
+            # Fill with dark blue for out-of-bounds area
+            self._screen.fill(_BACKGROUND_COLOR)
 
-        # Draw only live cells (more efficient than checking every cell)
-        for grid_x, grid_y in state.get_live_cells():
-            # Check if the live cell is within the viewport
-            viewport_x = grid_x - viewport.viewport_x
-            viewport_y = grid_y - viewport.viewport_y
-
-            if (0 <= viewport_x < viewport_cells_width and
-                0 <= viewport_y < viewport_cells_height):
-                # Draw white cell
-                pygame.draw.rect(
-                    self._screen,
-                    "white",
-                    pygame.Rect(
-                        viewport_x * viewport.cell_size,
-                        viewport_y * viewport.cell_size,
-                        viewport.cell_size,
-                        viewport.cell_size,
-                    ),
+            # Fill the in-bounds area with black, or overwrite it with pixels
+            if bounds is not None and pixel_grid is not None:
+                x0, y0, x1, y1 = bounds
+                cells = pixel_grid[y0:y1, x0:x1]
+                self._blit_pixels(cells, viewport.cell_size)
+                pixels_changed = self._last_pixels is None or not np.array_equal(
+                    cells, self._last_pixels
                 )
+                self._last_pixels = cells.copy()
+            elif bounds is not None:
+                self._screen.fill(_DEAD_COLOR, self._grid_rect)
+        finally:
+            self._screen.unlock()
 
-        # Render FPS counter in top right corner with monospaced font
-        font = pygame.font.SysFont("monospace", 24, bold=True)
-        fps_text = font.render(f"FPS: {fps:5.1f}", True, (0, 255, 0))
-        fps_rect = fps_text.get_rect()
-        fps_rect.topright = (self._screen.get_width() - 10, 10)
+        if bounds is not None and not pixel_path:
+            positions = self._cell_positions(state, viewport, bounds)
+
+        # Draw them all with a single batched blit of the white cell tile,
+        # rather than one draw per cell
+        if positions:
+            cell_surface = self._get_cell_surface(viewport.cell_size)
+            self._screen.fblits([(cell_surface, position) for position in positions])
+
+        # Render FPS counter in top right corner with monospaced font. While
+        # the displayed text is unchanged so are its surface and position, so
+        # only the blit (the fill above erased it) is needed.
+        fps_label = f"FPS: {fps:5.1f}"
+        fps_text, fps_rect = self._last_fps_text, self._last_fps_rect
+        if fps_label != self._last_fps_label or fps_text is None or fps_rect is None:
+            fps_text = self._get_fps_surface(fps_label)
+            fps_rect = fps_text.get_rect()
+            fps_rect.topright = (self._screen_width - 10, 10)
         self._screen.blit(fps_text, fps_rect)
 
         # Draw UI elements
         self._manager.draw_ui(self._screen)
+        ui_rects = self._ui_rects()
+
+        # Update display. While the view stays put, only cells that changed,
+        # a changed FPS counter and the UI elements (where they are now and
+        # where they were) differ from what is already on screen.
+        if view != self._last_view:
+            pygame.display.flip()
+        else:
+            if pixel_path:
+                dirty_rects = [self._grid_rect] if pixels_changed else []
+            else:
+                dirty_rects = self._cell_rects(
+                    positions ^ self._last_cells, viewport.cell_size
+                )
+            if fps_text is not self._last_fps_text:
+                if self._last_fps_rect is not None:
+                    dirty_rects.append(self._last_fps_rect)
+                dirty_rects.append(fps_rect)
+            dirty_rects += self._last_ui_rects + ui_rects
+            if len(dirty_rects) > _MAX_DIRTY_RECTS:
+                dirty_rects = [dirty_rects[0].unionall(dirty_rects[1:])]
+            pygame.display.update(dirty_rects)
 
-        # Update display
-        pygame.display.flip()
+        self._last_view = view
+        self._last_cells = positions
+        if not pixel_path:
+            self._last_pixels = None
+        self._last_fps_label = fps_label
+        self._last_fps_text = fps_text
+        self._last_fps_rect = fps_rect
+        self._last_ui_rects = ui_rects
@@ -1,5 +1,7 @@
 """UI facade that coordinates viewport, components, and rendering."""
 
+from collections.abc import Callable
+
 import pygame
 import pygame_gui
 
@@ -17,8 +19,29 @@ class UI:
     - ViewportManager: handles pan/zoom
     - UIComponents: handles buttons/menus/popups
     - Renderer: handles drawing to screen
+
+    Methods that only forward their arguments are the component's own bound
+    methods, assigned in __init__, so a call costs one dispatch rather than two.
     """
 
+    # Viewport delegates
+    set_viewport: Callable[[int, int], None]
+    start_drag: Callable[[tuple[int, int]], None]
+    update_drag: Callable[[tuple[int, int]], None]
+    end_drag: Callable[[], None]
+
+    # UI Components delegates
+    hide_context_menu: Callable[[], None]
+    has_context_menu: Callable[[], bool]
+    is_click_inside_context_menu: Callable[[tuple[int, int]], bool]
+    is_pause_button: Callable[[pygame_gui.core.UIElement], bool]
+    is_fps_limit_button: Callable[[pygame_gui.core.UIElement], bool]
+    get_engine_from_button: Callable[[pygame_gui.core.UIElement], str | None]
+    is_help_button: Callable[[pygame_gui.core.UIElement], bool]
+    show_help_popup: Callable[[list[str]], None]
+    hide_help_popup: Callable[[], None]
+    has_help_popup: Callable[[], bool]
+
     def __init__(
         self,
         width: int,
@@ -57,23 +80,23 @@ class UI:
             renderer if renderer is not None else Renderer(self._screen, manager)
         )
 
-    # Viewport delegation methods
-    def set_viewport(self, x: int, y: int) -> None:
-        """Set the viewport position."""
-        self._viewport.set_viewport(x, y)
-
-    def start_drag(self, mouse_pos: tuple[int, int]) -> None:
-        """Start panning with mouse drag."""
-        self._viewport.start_drag(mouse_pos)
-
-    def update_drag(self, mouse_pos: tuple[int, int]) -> None:
-        """Update viewport position during drag."""
-        self._viewport.update_drag(mouse_pos)
-
-    def end_drag(self) -> None:
-        """End panning drag."""
-        self._viewport.end_drag()
-
+        # Bind the pure forwarding methods straight to their components
+        self.set_viewport = self._viewport.set_viewport
+        self.start_drag = self._viewport.start_drag
+        self.update_drag = self._viewport.update_drag
+        self.end_drag = self._viewport.end_drag
+        self.hide_context_menu = self._components.hide_context_menu
+        self.has_context_menu = self._components.has_context_menu
+        self.is_click_inside_context_menu = self._components.is_click_inside_context_menu
+        self.is_pause_button = self._components.is_pause_button
+        self.is_fps_limit_button = self._components.is_fps_limit_button
+        self.get_engine_from_button = self._components.get_engine_from_button
+        self.is_help_button = self._components.is_help_button
+        self.show_help_popup = self._components.show_help_popup
+        self.hide_help_popup = self._components.hide_help_popup
+        self.has_help_popup = self._components.has_help_popup
+
+    # Screen size dependent delegation method
     def zoom(
         self,
         delta: int,
@@ -91,53 +114,13 @@ class UI:
             max_grid_height,
         )
 
-    # UI Components delegation methods
+    # UI Components delegation method
     def show_context_menu(
         self, position: tuple[int, int], is_paused: bool, available_engines: list[str], current_engine: str, fps_limit: int = 60
     ) -> None:
         """Show context menu at the given position with engine selection and FPS limit toggle."""
         self._components.show_context_menu(position, is_paused, available_engines, current_engine, fps_limit)
 
-    def hide_context_menu(self) -> None:
-        """Hide the context menu."""
-        self._components.hide_context_menu()
-
-    def has_context_menu(self) -> bool:
-        """Check if context menu is visible."""
-        return self._components.has_context_menu()
-
-    def is_click_inside_context_menu(self, position: tuple[int, int]) -> bool:
-        """Check if a click position is inside the context menu."""
-        return self._components.is_click_inside_context_menu(position)
-
-    def is_pause_button(self, ui_element: pygame_gui.core.UIElement) -> bool:
-        """Check if UI element is the pause button."""
-        return self._components.is_pause_button(ui_element)
-
-    def is_fps_limit_button(self, ui_element: pygame_gui.core.UIElement) -> bool:
-        """Check if UI element is the FPS limit button."""
-        return self._components.is_fps_limit_button(ui_element)
-
-    def get_engine_from_button(self, ui_element: pygame_gui.core.UIElement) -> str | None:
-        """Get engine name if UI element is an engine selection button."""
-        return self._components.get_engine_from_button(ui_element)
-
-    def is_help_button(self, ui_element: pygame_gui.core.UIElement) -> bool:
-        """Check if UI element is the help button."""
-        return self._components.is_help_button(ui_element)
-
-    def show_help_popup(self) -> None:
-        """Show help popup with usage instructions."""
-        self._components.show_help_popup()
-
-    def hide_help_popup(self) -> None:
-        """Hide the help popup."""
-        self._components.hide_help_popup()
-
-    def has_help_popup(self) -> bool:
-        """Check if help popup is visible."""
-        return self._components.has_help_popup()
-
     # Rendering delegation method
     def render(self, state: State, fps: float = 0.0) -> None:
         """Render the game state and UI."""
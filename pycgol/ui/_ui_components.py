@@ -25,9 +25,12 @@ class UIComponents:
         self._context_menu_buttons: dict[str, pygame_gui.elements.UIButton] = {}
         self._help_popup: pygame_gui.windows.UIMessageWindow | None = None
 
-        # Create help button in bottom left corner
+        self._create_help_button()
+
+    def _create_help_button(self) -> None:
+        """Create the help button in the bottom left corner of the screen."""
         self._help_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect((10, screen_height - 50), (40, 40)),
+            relative_rect=pygame.Rect((10, self._screen_height - 50), (40, 40)),
             text="?",
             manager=self._manager,
             object_id="#help_button",
@@ -154,19 +157,24 @@ class UIComponents:
         """Check if the given UI element is the help button."""
         return ui_element == self._help_button
 
-    def show_help_popup(self) -> None:
-        """Show help popup with usage instructions."""
+    def show_help_popup(self, available_engines: list[str]) -> None:
+        """
+        Show help popup with usage instructions.
+
+        Args:
+            available_engines: Names of the engines the context menu offers
+        """
         if self._help_popup is not None:
             return  # Already showing
 
-        help_text = """<b>Conway's Game of Life - Controls</b><br>
+        help_text = f"""<b>Conway's Game of Life - Controls</b><br>
 <b>Mouse Controls:</b><br>
 * Left Click + Drag: Pan the view<br>
 * Mouse Wheel: Zoom in/out<br>
 * Right Click: Open context menu<br>
   - Pause/Resume simulation<br>
   - Toggle FPS limit (60 FPS / unlimited)<br>
-  - Switch between engines (numpy/loop/sparse)<br>
+  - Switch between engines ({"/".join(available_engines)})<br>
 * Left Click outside menu: Close menu<br>
 * Click '?' button: Show this help<br>
 <br>
@@ -1,9 +1,22 @@
 """Viewport management for panning and zooming in the Game of Life grid."""
 
+# Range of cell sizes, in pixels, reachable by zooming
+_MIN_CELL_SIZE = 2
+_MAX_CELL_SIZE = 50
+
 
 class ViewportManager:
     """Manages viewport position, panning, and zooming."""
 
+    __slots__ = (
+        "_cell_size",
+        "_viewport_x",
+        "_viewport_y",
+        "_dragging",
+        "_drag_start_pos",
+        "_drag_start_viewport",
+    )
+
     def __init__(self, cell_size: int = 10) -> None:
         """
         Initialize the viewport manager.
@@ -35,6 +48,28 @@ class ViewportManager:
         """Get viewport Y position in grid cells."""
         return self._viewport_y
 
+    @property
+    def position(self) -> tuple[int, int]:
+        """Get viewport (X, Y) position in grid cells."""
+        return (self._viewport_x, self._viewport_y)
+
+    def set_cell_size(self, cell_size: int) -> None:
+        """
+        Set the size of each cell in pixels.
+
+        Args:
+            cell_size: New cell size, within the range zoom allows (2 to 50)
+
+        Raises:
+            ValueError: If cell_size is outside that range
+        """
+        if not _MIN_CELL_SIZE <= cell_size <= _MAX_CELL_SIZE:
+            raise ValueError(
+                f"Cell size {cell_size} is outside the range "
+                f"({_MIN_CELL_SIZE}, {_MAX_CELL_SIZE})."
+            )
+        self._cell_size = cell_size
+
     def set_viewport(self, x: int, y: int) -> None:
         """Set the viewport position (which part of the game grid to display)."""
         self._viewport_x = x
@@ -89,9 +124,9 @@ class ViewportManager:
 
         # Adjust cell size (zoom in/out)
         if delta > 0:  # Zoom in
-            self._cell_size = min(self._cell_size + 2, 50)
+            self._cell_size = min(self._cell_size + 2, _MAX_CELL_SIZE)
         else:  # Zoom out
-            self._cell_size = max(self._cell_size - 2, 2)
+            self._cell_size = max(self._cell_size - 2, _MIN_CELL_SIZE)
 
         if old_cell_size != self._cell_size:
             # Calculate which cell is under the mouse before zoom
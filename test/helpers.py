@@ -0,0 +1,24 @@
+"""Helpers for inspecting DenseState grids in tests without per-cell loops."""
+
+import numpy as np
+
+from pycgol.state import DenseState
+
+
+def count_live(state: DenseState) -> int:
+    """Number of live cells in the grid."""
+    return int(state._grid.sum())
+
+
+def live_cells(state: DenseState) -> set[tuple[int, int]]:
+    """Set of (x, y) coordinates of the live cells in the grid."""
+    ys, xs = np.nonzero(state._grid)
+    return set(zip(xs.tolist(), ys.tolist()))
+
+
+def grid_with(width: int, height: int, cells) -> np.ndarray:
+    """A (height, width) uint8 grid with only the given (x, y) cells alive."""
+    grid = np.zeros((height, width), dtype=np.uint8)
+    for x, y in cells:
+        grid[y, x] = 1
+    return grid
@@ -325,3 +325,78 @@ class TestApplication:
 
         with pytest.raises(KeyError):
             app.set_engine_by_name("nonexistent")
+
+    @patch("pycgol._application.pygame")
+    @patch("pycgol._application.pygame_gui")
+    @patch("pycgol._application.UI")
+    def test_backend_environment_variable_selects_engine(
+        self,
+        mock_ui_class,
+        mock_pygame_gui,
+        mock_pygame,
+        monkeypatch,
+    ):
+        """Test that PYCGOL_BACKEND picks the starting engine by name."""
+        monkeypatch.setenv("PYCGOL_BACKEND", "loop")
+        mock_initializer, _ = create_mock_world_initializer()
+
+        app = Application(world_initializer=mock_initializer)
+
+        assert app.get_current_engine() == LoopEngine
+
+    @patch("pycgol._application.pygame")
+    @patch("pycgol._application.pygame_gui")
+    @patch("pycgol._application.UI")
+    def test_unregistered_backend_environment_variable_is_ignored(
+        self,
+        mock_ui_class,
+        mock_pygame_gui,
+        mock_pygame,
+        monkeypatch,
+    ):
+        """Test that an unavailable PYCGOL_BACKEND keeps the default engine."""
+        monkeypatch.setenv("PYCGOL_BACKEND", "nonexistent")
+        mock_initializer, _ = create_mock_world_initializer()
+
+        app = Application(world_initializer=mock_initializer)
+
+        assert app.get_current_engine() == NumpyEngine
+
+    @patch("pycgol._application.pygame")
+    @patch("pycgol._application.pygame_gui")
+    @patch("pycgol._application.UI")
+    def test_explicit_engine_overrides_backend_environment_variable(
+        self,
+        mock_ui_class,
+        mock_pygame_gui,
+        mock_pygame,
+        monkeypatch,
+    ):
+        """Test that an engine passed in wins over PYCGOL_BACKEND."""
+        monkeypatch.setenv("PYCGOL_BACKEND", "loop")
+        mock_initializer, _ = create_mock_world_initializer()
+
+        app = Application(engine=NumpyEngine, world_initializer=mock_initializer)
+
+        assert app.get_current_engine() == NumpyEngine
+
+    @patch("pycgol._application.pygame")
+    @patch("pycgol._application.pygame_gui")
+    @patch("pycgol._application.UI")
+    def test_custom_registry_ignores_backend_environment_variable(
+        self,
+        mock_ui_class,
+        mock_pygame_gui,
+        mock_pygame,
+        monkeypatch,
+    ):
+        """Test that PYCGOL_BACKEND does not pick from a registry passed in."""
+        monkeypatch.setenv("PYCGOL_BACKEND", "loop")
+        mock_initializer, _ = create_mock_world_initializer()
+        custom_registry = EngineRegistry()
+        custom_registry.register("numpy", NumpyEngine, is_default=True)
+        custom_registry.register("loop", LoopEngine)
+
+        app = Application(engine_registry=custom_registry, world_initializer=mock_initializer)
+
+        assert app.get_current_engine() == NumpyEngine
@@ -1,31 +1,44 @@
+import numpy as np
 import pytest
 
-from pycgol.engines import LoopEngine, NumpyEngine, SparseEngine
+from pycgol.engines import (
+    CudaEngine,
+    LoopEngine,
+    NumbaEngine,
+    NumpyEngine,
+    PackedEngine,
+    SparseEngine,
+)
+from pycgol.engines._numba_engine import _step, _step_parallel
+from pycgol.engines._numpy_engine import _kernel_for
 from pycgol.state import SparseState, DenseState
 
+# Expected neighbours of cells in a 10x10 grid
+_CORNER_NB = frozenset({(1, 0), (1, 1), (0, 1)})
+_CENTER_NB = frozenset({(4, 4), (5, 4), (6, 4), (4, 5), (6, 5), (4, 6), (5, 6), (6, 6)})
+_EDGE_NB = frozenset({(4, 0), (6, 0), (4, 1), (5, 1), (6, 1)})
+_BOTTOM_RIGHT_NB = frozenset({(8, 8), (9, 8), (8, 9)})
+
 
 class TestLoopEngine:
     """Test the original nested loop implementation."""
 
     def test_neighbours_corner_cell(self):
         neighbours = LoopEngine._neighbours((0, 0), 10, 10)
-        assert set(neighbours) == set([(1, 0), (1, 1), (0, 1)])
+        assert frozenset(neighbours) == _CORNER_NB
 
     def test_neighbours_center_cell(self):
         neighbours = LoopEngine._neighbours((5, 5), 10, 10)
-        expected = [(4, 4), (5, 4), (6, 4), (4, 5), (6, 5), (4, 6), (5, 6), (6, 6)]
-        assert set(neighbours) == set(expected)
+        assert frozenset(neighbours) == _CENTER_NB
         assert len(neighbours) == 8
 
     def test_neighbours_edge_cell(self):
         neighbours = LoopEngine._neighbours((5, 0), 10, 10)
-        expected = [(4, 0), (6, 0), (4, 1), (5, 1), (6, 1)]
-        assert set(neighbours) == set(expected)
+        assert frozenset(neighbours) == _EDGE_NB
 
     def test_neighbours_bottom_right_corner(self):
         neighbours = LoopEngine._neighbours((9, 9), 10, 10)
-        expected = [(8, 8), (9, 8), (8, 9)]
-        assert set(neighbours) == set(expected)
+        assert frozenset(neighbours) == _BOTTOM_RIGHT_NB
 
     def test_neighbours_invalid_coordinates(self):
         with pytest.raises(ValueError):
@@ -37,6 +50,11 @@ class TestLoopEngine:
         with pytest.raises(ValueError):
             LoopEngine._neighbours((-1, 5), 10, 10)
 
+    def test_neighbours_are_cached(self):
+        first = LoopEngine._neighbours((3, 4), 10, 10)
+        assert isinstance(first, tuple)
+        assert LoopEngine._neighbours((3, 4), 10, 10) is first
+
     def test_alive_neighbours_count(self):
         state = DenseState(5, 5)
         state[1, 1] = True  # top-left
@@ -51,6 +69,21 @@ class TestLoopEngine:
         alive_count = LoopEngine._alive_neighbours((2, 2), state)
         assert alive_count == 0
 
+    @pytest.mark.parametrize("state_type", [DenseState, SparseState])
+    def test_alive_neighbours_at_corner(self, state_type):
+        state = state_type(5, 5)
+        state[0, 0] = True  # the cell itself is not counted
+        state[1, 0] = True
+        state[1, 1] = True
+        state[2, 2] = True  # outside the window
+
+        assert LoopEngine._alive_neighbours((0, 0), state) == 2
+
+    @pytest.mark.parametrize("state_type", [DenseState, SparseState])
+    def test_alive_neighbours_invalid_coordinates(self, state_type):
+        with pytest.raises(ValueError):
+            LoopEngine._alive_neighbours((-1, 2), state_type(5, 5))
+
     def test_next_cell_state_underpopulation(self):
         """Any live cell with fewer than two live neighbours dies"""
         state = DenseState(5, 5)
@@ -253,68 +286,121 @@ class TestNumpyEngine:
         next_state = NumpyEngine.next_state(state)
         assert next_state[2, 2] is True
 
+    @pytest.mark.parametrize("engine", [NumpyEngine, PackedEngine, NumbaEngine])
+    def test_next_state_into_reuses_matching_buffer(self, engine):
+        """Test that a spare DenseState of the same size is overwritten"""
+        state = DenseState(5, 5)
+        state[1, 2] = True
+        state[2, 2] = True
+        state[3, 2] = True
+        out = DenseState(5, 5)
+        out[0, 0] = True  # stale contents are replaced
+
+        next_state = engine.next_state_into(state, out)
+
+        assert next_state is out
+        assert next_state.get_live_cells() == {(2, 1), (2, 2), (2, 3)}
+
+    @pytest.mark.parametrize("engine", [NumpyEngine, PackedEngine, NumbaEngine])
+    def test_next_state_into_allocates_for_unusable_buffer(self, engine):
+        """Test that the input, mis-sized or sparse buffers are not reused"""
+        state = DenseState(5, 5)
+        state[2, 2] = True
+
+        for out in (None, state, DenseState(4, 5), SparseState(5, 5)):
+            next_state = engine.next_state_into(state, out)
+            assert next_state is not out
+            assert isinstance(next_state, DenseState)
+
+        assert state[2, 2] is True
+
+    def test_next_state_into_default_ignores_buffer(self):
+        """Test that engines without buffer reuse fall back to next_state"""
+        state = DenseState(5, 5)
+        out = DenseState(5, 5)
+
+        assert LoopEngine.next_state_into(state, out) is not out
+
+    def test_kernel_is_cached_per_grid_size(self):
+        """Test that the specialised kernel is built once per grid size"""
+        assert _kernel_for(5, 5) is _kernel_for(5, 5)
+        assert _kernel_for(5, 5) is not _kernel_for(4, 4)
+
+    def test_repeated_calls_reuse_kernel_correctly(self):
+        """Test that reusing a cached kernel does not leak state between calls"""
+        state = SparseState(5, 5)
+        state[1, 2] = True
+        state[2, 2] = True
+        state[3, 2] = True
+
+        first = NumpyEngine.next_state(state)
+        second = NumpyEngine.next_state(first)
+
+        assert first.get_live_cells() == {(2, 1), (2, 2), (2, 3)}
+        assert second.get_live_cells() == {(1, 2), (2, 2), (3, 2)}
+
+
+def _blinker(state):
+    state[1, 2] = True
+    state[2, 2] = True
+    state[3, 2] = True
+
+
+def _block(state):
+    state[1, 1] = True
+    state[1, 2] = True
+    state[2, 1] = True
+    state[2, 2] = True
+
+
+def _glider(state):
+    state[1, 0] = True
+    state[2, 1] = True
+    state[0, 2] = True
+    state[1, 2] = True
+    state[2, 2] = True
+
+
+PATTERNS = [_blinker, _block, _glider]
+
+
+def _to_array(state):
+    """Materialise any state as a (height, width) boolean array."""
+    grid = np.zeros((state.height, state.width), dtype=bool)
+    for x, y in state.get_live_cells():
+        grid[y, x] = True
+    return grid
+
 
 class TestEngineEquivalence:
-    """Test that both engines produce the same results."""
+    """Test that all engines produce the same results as the reference LoopEngine."""
+
+    @pytest.fixture(scope="module", params=PATTERNS, ids=lambda p: p.__name__.lstrip("_"))
+    def pattern(self, request):
+        return request.param
+
+    @pytest.fixture(scope="module")
+    def reference(self, pattern):
+        """Next generation of the pattern, computed once by the reference engine."""
+        state = DenseState(10, 10)
+        pattern(state)
+        return _to_array(LoopEngine.next_state(state))
 
+    @pytest.mark.parametrize("state_type", [DenseState, SparseState])
     @pytest.mark.parametrize(
-        "pattern_setup",
-        [
-            # Blinker
-            lambda s: (
-                s.__setitem__((1, 2), True),
-                s.__setitem__((2, 2), True),
-                s.__setitem__((3, 2), True),
-            ),
-            # Block
-            lambda s: (
-                s.__setitem__((1, 1), True),
-                s.__setitem__((1, 2), True),
-                s.__setitem__((2, 1), True),
-                s.__setitem__((2, 2), True),
-            ),
-            # Glider
-            lambda s: (
-                s.__setitem__((1, 0), True),
-                s.__setitem__((2, 1), True),
-                s.__setitem__((0, 2), True),
-                s.__setitem__((1, 2), True),
-                s.__setitem__((2, 2), True),
-            ),
-        ],
+        "engine",
+        [LoopEngine, NumpyEngine, SparseEngine, PackedEngine, NumbaEngine, CudaEngine],
     )
-    def test_engines_produce_same_results(self, pattern_setup):
-        """Verify both engines produce identical results for various patterns."""
-        # Setup state for LoopEngine
-        state_loop = DenseState(10, 10)
-        pattern_setup(state_loop)
-
-        # Setup identical state for NumpyEngine
-        state_numpy = SparseState(10, 10)
-        pattern_setup(state_numpy)
-
-        # Run one generation on both
-        next_loop = LoopEngine.next_state(state_loop)
-        next_numpy = NumpyEngine.next_state(state_numpy)
-
-        # Setup identical state for SparseEngine
-        state_sparse = SparseState(10, 10)
-        pattern_setup(state_sparse)
-
-        # Run one generation on all three
-        next_loop = LoopEngine.next_state(state_loop)
-        next_numpy = NumpyEngine.next_state(state_numpy)
-        next_sparse = SparseEngine.next_state(state_sparse)
-
-        # Compare all cells
-        for y in range(10):
-            for x in range(10):
-                loop_val = next_loop[x, y]
-                numpy_val = next_numpy[x, y]
-                sparse_val = next_sparse[x, y]
-                assert loop_val == numpy_val == sparse_val, (
-                    f"Mismatch at ({x}, {y}): Loop={loop_val}, Numpy={numpy_val}, Sparse={sparse_val}"
-                )
+    def test_engines_produce_same_results(self, engine, state_type, pattern, reference):
+        """Verify each engine matches the reference for various patterns."""
+        state = state_type(10, 10)
+        pattern(state)
+
+        result = _to_array(engine.next_state(state))
+
+        assert np.array_equal(result, reference), (
+            f"{engine.__name__} mismatch at {np.argwhere(result != reference).tolist()}"
+        )
 
 
 class TestSparseEngine:
@@ -427,3 +513,131 @@ class TestSparseEngine:
         # Should convert to SparseState
         assert isinstance(next_state, SparseState)
         assert next_state[2, 2] is False  # Dies from underpopulation
+
+    @pytest.mark.parametrize("size", [5, 500])
+    def test_blinker_on_small_and_large_grids(self, size):
+        """Test both tallying strategies (histogram on small grids, sort on
+        large sparse ones) give the same result."""
+        state = SparseState(size, size)
+        state[1, 2] = True
+        state[2, 2] = True
+        state[3, 2] = True
+
+        next_state = SparseEngine.next_state(state)
+
+        assert next_state.get_live_cells() == {(2, 1), (2, 2), (2, 3)}
+
+
+class TestPackedEngine:
+    """Test the bit-packed implementation."""
+
+    def test_next_state_blinker_pattern(self):
+        """Test the classic blinker pattern."""
+        state = DenseState(5, 5)
+        state[1, 2] = True
+        state[2, 2] = True
+        state[3, 2] = True
+
+        next_state = PackedEngine.next_state(state)
+
+        assert next_state.get_live_cells() == {(2, 1), (2, 2), (2, 3)}
+
+    def test_next_state_block_pattern(self):
+        """Test the block pattern (still life)."""
+        state = DenseState(4, 4)
+        state[1, 1] = True
+        state[1, 2] = True
+        state[2, 1] = True
+        state[2, 2] = True
+
+        next_state = PackedEngine.next_state(state)
+
+        assert next_state.get_live_cells() == {(1, 1), (1, 2), (2, 1), (2, 2)}
+
+    def test_next_state_empty_grid(self):
+        """Test that empty grid stays empty."""
+        next_state = PackedEngine.next_state(DenseState(5, 5))
+        assert next_state.get_live_cells() == set()
+
+    @pytest.mark.parametrize("engine", [PackedEngine, NumbaEngine, CudaEngine])
+    def test_next_state_dimensions_preserved(self, engine):
+        """Test that dimensions are preserved."""
+        next_state = engine.next_state(DenseState(7, 3))
+
+        assert next_state.width == 7
+        assert next_state.height == 3
+
+    @pytest.mark.parametrize("engine", [PackedEngine, NumbaEngine, CudaEngine])
+    def test_returns_dense_state(self, engine):
+        """Test that the dense engines convert SparseState to DenseState."""
+        state = SparseState(5, 5)
+        state[2, 2] = True
+
+        next_state = engine.next_state(state)
+        assert isinstance(next_state, DenseState)
+        assert next_state[2, 2] is False
+
+    def test_overpopulation_with_eight_neighbours(self):
+        """Test that a count of 8 neighbours kills the cell."""
+        state = DenseState(3, 3)
+        for y in range(3):
+            for x in range(3):
+                state[x, y] = True
+
+        next_state = PackedEngine.next_state(state)
+        assert next_state[1, 1] is False
+
+    @pytest.mark.parametrize("x", [62, 63, 64, 127, 128])
+    def test_blinker_across_word_boundaries(self, x):
+        """Test that neighbours are carried across 64-bit word boundaries."""
+        state = DenseState(130, 5)
+        state[x - 1, 2] = True
+        state[x, 2] = True
+        state[x + 1, 2] = True
+
+        next_state = PackedEngine.next_state(state)
+
+        assert next_state.get_live_cells() == {(x, 1), (x, 2), (x, 3)}
+
+
+class TestNumbaEngine:
+    """Test the JIT-compiled implementation."""
+
+    def test_parallel_kernel_matches_serial(self):
+        """Test that the row-parallel kernel computes the same generation."""
+        rng = np.random.default_rng(0)
+        grid = (rng.random((80, 96)) < 0.3).astype(np.uint8)
+        serial = np.zeros_like(grid)
+        parallel = np.zeros_like(grid)
+
+        _step(grid, serial)
+        _step_parallel(grid, parallel)
+
+        np.testing.assert_array_equal(parallel, serial)
+
+    def test_next_state_large_grid_matches_numpy(self):
+        """Test a grid above the parallel threshold against NumpyEngine."""
+        state = DenseState(100, 100)
+        for x, y in [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2), (50, 50), (51, 50), (52, 50)]:
+            state[x, y] = True
+
+        next_state = NumbaEngine.next_state(state)
+
+        assert next_state.get_live_cells() == NumpyEngine.next_state(state).get_live_cells()
+
+
+class TestCudaEngine:
+    """Test the GPU implementation (or its CPU fallback)."""
+
+    def test_falls_back_to_packed_engine_without_gpu(self, monkeypatch):
+        """Test that without a GPU the CPU bit-packed path is used."""
+        monkeypatch.setattr(CudaEngine, "gpu_available", classmethod(lambda cls: False))
+        state = DenseState(70, 3)
+        state[62, 1] = True
+        state[63, 1] = True
+        state[64, 1] = True
+
+        next_state = CudaEngine.next_state(state)
+
+        assert isinstance(next_state, DenseState)
+        assert next_state.get_live_cells() == {(63, 0), (63, 1), (63, 2)}
@@ -0,0 +1,49 @@
+"""Comparative benchmarks for the Game of Life engines.
+
+They are marked ``bench`` and left out of the default run; run them on their
+own with ``python -m pytest test/test_engine_bench.py -m bench``. To gate
+against regressions, save a baseline and compare later runs against it::
+
+    python -m pytest test/test_engine_bench.py -m bench --benchmark-autosave
+    python -m pytest test/test_engine_bench.py -m bench --benchmark-compare \\
+        --benchmark-compare-fail=mean:20%
+"""
+
+import numpy as np
+import pytest
+
+from pycgol.engines import LoopEngine, NumbaEngine, NumpyEngine, PackedEngine, SparseEngine
+from pycgol.state import DenseState
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.bench
+
+_SIZE = 256
+_SEED = 20240101
+_DENSITY = 0.3
+
+
+@pytest.fixture(scope="module")
+def random_dense():
+    """A fixed, seeded 256x256 random pattern."""
+    rng = np.random.default_rng(_SEED)
+    state = DenseState(_SIZE, _SIZE)
+    # Write the whole (height, width) grid at once rather than cell by cell
+    state._grid[:] = rng.random((_SIZE, _SIZE)) < _DENSITY
+    return state
+
+
+@pytest.mark.parametrize(
+    "engine", [LoopEngine, NumpyEngine, SparseEngine, PackedEngine, NumbaEngine]
+)
+def test_bench_next_state(benchmark, engine, random_dense):
+    """Time one generation of each engine on its preferred state type."""
+    benchmark.group = "next_state"
+    state = engine.optimize_state(random_dense)
+
+    result = benchmark.pedantic(
+        engine.next_state, args=(state,), rounds=5, iterations=1, warmup_rounds=1
+    )
+
+    assert (result.width, result.height) == (_SIZE, _SIZE)
@@ -0,0 +1,48 @@
+from pycgol.application import GameLoop
+from pycgol.engines import LoopEngine, NumpyEngine
+from pycgol.state import DenseState
+
+
+def _blinker() -> DenseState:
+    state = DenseState(5, 5)
+    state[1, 2] = True
+    state[2, 2] = True
+    state[3, 2] = True
+    return state
+
+
+class TestGameLoop:
+    def test_update_waits_for_update_interval(self):
+        game_loop = GameLoop(updates_per_second=10)
+        state = _blinker()
+
+        assert game_loop.update(0.05, state, NumpyEngine) is state
+
+    def test_paused_update_returns_same_state(self):
+        game_loop = GameLoop(updates_per_second=10)
+        game_loop.pause()
+        state = _blinker()
+
+        assert game_loop.update(1.0, state, NumpyEngine) is state
+
+    def test_update_reuses_previous_generation_as_buffer(self):
+        game_loop = GameLoop(updates_per_second=10)
+        first = _blinker()
+
+        second = game_loop.update(1.0, first, NumpyEngine)
+        third = game_loop.update(1.0, second, NumpyEngine)
+
+        # The blinker has period two, and the first buffer is recycled
+        assert third is first
+        assert third.get_live_cells() == {(1, 2), (2, 2), (3, 2)}
+        assert second.get_live_cells() == {(2, 1), (2, 2), (2, 3)}
+
+    def test_update_with_engine_without_buffer_reuse(self):
+        game_loop = GameLoop(updates_per_second=10)
+        first = _blinker()
+
+        second = game_loop.update(1.0, first, LoopEngine)
+        third = game_loop.update(1.0, second, LoopEngine)
+
+        assert third is not first
+        assert third.get_live_cells() == first.get_live_cells()
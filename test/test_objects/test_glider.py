@@ -1,6 +1,10 @@
-from pycgol.state import DenseState as State
+import numpy as np
+
+from pycgol.state import DenseState as State, SparseState
 from pycgol.objects._glider import Glider
 
+from ..helpers import grid_with
+
 
 class TestGlider:
     def test_glider_placement_valid_position(self):
@@ -17,14 +21,10 @@ class TestGlider:
             (4, 5),  # top middle
         ]
 
-        for x, y in expected_cells:
-            assert result_state[x, y] is True
-
-        # Check that other cells remain False
-        for y in range(10):
-            for x in range(10):
-                if (x, y) not in expected_cells:
-                    assert result_state[x, y] is False
+        # Check that exactly the glider cells are set
+        np.testing.assert_array_equal(
+            result_state._grid, grid_with(10, 10, expected_cells)
+        )
 
     def test_glider_placement_returns_same_state_object(self):
         state = State(10, 10)
@@ -68,14 +68,10 @@ class TestGlider:
             (4, 3),  # Only these two cells are within bounds
         ]
 
-        for x, y in expected_cells:
-            assert result_state[x, y] is True
-
-        # Verify that other cells remain False
-        for y in range(5):
-            for x in range(5):
-                if (x, y) not in expected_cells:
-                    assert result_state[x, y] is False
+        # Verify that no other cells are set
+        np.testing.assert_array_equal(
+            result_state._grid, grid_with(5, 5, expected_cells)
+        )
 
     def test_glider_placement_completely_out_of_bounds(self):
         state = State(5, 5)
@@ -85,9 +81,7 @@ class TestGlider:
         result_state = glider.place((10, 10), state)
 
         # No cells should be set since all glider cells would be out of bounds
-        for y in range(5):
-            for x in range(5):
-                assert result_state[x, y] is False
+        np.testing.assert_array_equal(result_state._grid, grid_with(5, 5, []))
 
     def test_glider_placement_at_origin(self):
         state = State(10, 10)
@@ -140,3 +134,11 @@ class TestGlider:
         expected_cells = [(0, 0), (1, 0), (2, 0), (2, 1), (1, 2)]
         for x, y in expected_cells:
             assert result_state[x, y] is True
+
+    def test_glider_placement_on_sparse_state(self):
+        state = SparseState(10, 10)
+        result_state = Glider().place((8, 3), state)
+
+        # Cells falling off the right edge are dropped
+        assert result_state is state
+        assert state.get_live_cells() == {(8, 3), (9, 3), (9, 5)}
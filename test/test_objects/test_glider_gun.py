@@ -1,6 +1,10 @@
+import pytest
+
 from pycgol.state import DenseState as State
 from pycgol.objects._glide_gun import GliderGun
 
+from ..helpers import count_live, live_cells
+
 
 class TestGliderGun:
     def test_glider_gun_placement_no_rotation(self):
@@ -48,7 +52,7 @@ class TestGliderGun:
         assert result_state is state
         # After 180° rotation, pattern should be upside down and flipped
         # Check that at least some cells are set
-        cell_count = sum(1 for y in range(50) for x in range(50) if state[x, y])
+        cell_count = count_live(state)
         assert cell_count == len(GliderGun._CELLS)
 
     def test_glider_gun_placement_270_degrees(self):
@@ -59,7 +63,7 @@ class TestGliderGun:
 
         assert result_state is state
         # After 270° rotation, pattern should be rotated CCW
-        cell_count = sum(1 for y in range(50) for x in range(50) if state[x, y])
+        cell_count = count_live(state)
         assert cell_count == len(GliderGun._CELLS)
 
     def test_glider_gun_cells_count(self):
@@ -69,7 +73,7 @@ class TestGliderGun:
         gun.place((10, 10), state, rotation=0)
 
         # Count alive cells
-        cell_count = sum(1 for y in range(60) for x in range(60) if state[x, y])
+        cell_count = count_live(state)
         assert cell_count == len(GliderGun._CELLS)
 
     def test_glider_gun_pattern_constant(self):
@@ -113,7 +117,7 @@ class TestGliderGun:
         assert state[10, 14] is True  # (0, 4)
 
         # Check that cells were placed (but not all 36 since some are out of bounds)
-        cell_count = sum(1 for y in range(15) for x in range(40) if state[x, y])
+        cell_count = count_live(state)
         assert 0 < cell_count < len(GliderGun._CELLS)
 
     def test_glider_gun_placement_completely_out_of_bounds(self):
@@ -123,7 +127,7 @@ class TestGliderGun:
         gun.place((50, 50), state, rotation=0)
 
         # No cells should be placed
-        cell_count = sum(1 for y in range(10) for x in range(10) if state[x, y])
+        cell_count = count_live(state)
         assert cell_count == 0
 
     def test_multiple_glider_gun_placements(self):
@@ -137,7 +141,7 @@ class TestGliderGun:
 
         # Should have cells from both guns
         # (might overlap, so count >= len(_CELLS))
-        cell_count = sum(1 for y in range(100) for x in range(100) if state[x, y])
+        cell_count = count_live(state)
         assert cell_count >= len(GliderGun._CELLS)
 
     def test_rotate_90_cw_helper(self):
@@ -161,7 +165,7 @@ class TestGliderGun:
             gun = GliderGun()
             gun.place((10, 10), state, rotation=rotation)
 
-            cell_count = sum(1 for y in range(60) for x in range(60) if state[x, y])
+            cell_count = count_live(state)
             assert cell_count == len(GliderGun._CELLS), (
                 f"Rotation {rotation} produced {cell_count} cells, expected {len(GliderGun._CELLS)}"
             )
@@ -177,8 +181,8 @@ class TestGliderGun:
         gun2.place((10, 10), state_90, rotation=90)
 
         # Collect cell positions
-        cells_0 = {(x, y) for y in range(60) for x in range(60) if state_0[x, y]}
-        cells_90 = {(x, y) for y in range(60) for x in range(60) if state_90[x, y]}
+        cells_0 = live_cells(state_0)
+        cells_90 = live_cells(state_90)
 
         # Patterns should be different
         assert cells_0 != cells_90
@@ -186,3 +190,16 @@ class TestGliderGun:
     def test_glider_gun_has_no_dead_cells_in_pattern(self):
         """Test that all cells in _CELLS are unique (no duplicates)."""
         assert len(GliderGun._CELLS) == len(set(GliderGun._CELLS))
+
+    def test_rotation_tables_match_apply_rotation(self):
+        """Test that the precomputed tables match rotating on the fly."""
+        gun = GliderGun()
+
+        for rotation in (0, 90, 180, 270):
+            table = {tuple(cell) for cell in gun._rotated_cells[rotation].tolist()}
+            assert table == set(gun._apply_rotation(rotation))
+
+    def test_invalid_rotation_raises(self):
+        """Test that placing with an unsupported rotation raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid rotation: 45"):
+            GliderGun().place((10, 10), State(60, 60), rotation=45)
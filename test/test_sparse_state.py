@@ -1,8 +1,9 @@
 """Tests for SparseState implementation."""
 
+import numpy as np
 import pytest
 
-from pycgol.state import SparseState, DenseState
+from pycgol.state import SparseState, DenseState, State
 
 
 class TestSparseState:
@@ -82,6 +83,10 @@ class TestSparseState:
         with pytest.raises(ValueError):
             SparseState(10, 0)
 
+    def test_has_no_instance_dict(self):
+        """Test that SparseState instances use __slots__ storage."""
+        assert not hasattr(SparseState(10, 10), "__dict__")
+
     def test_get_live_cells_empty(self):
         """Test get_live_cells returns empty set for dead grid."""
         state = SparseState(10, 10)
@@ -148,10 +153,127 @@ class TestSparseState:
         assert sparse2[8, 9] is True
         assert sparse1[8, 9] is False
 
+    def test_from_dense(self):
+        """Test vectorized conversion from DenseState."""
+        dense = DenseState(7, 4)
+        dense[0, 0] = True
+        dense[6, 3] = True
+        dense[2, 1] = True
+
+        sparse = SparseState.from_dense(dense)
+        assert (sparse.width, sparse.height) == (7, 4)
+        assert sparse.get_live_cells() == {(0, 0), (6, 3), (2, 1)}
+
+    def test_to_dense(self):
+        """Test vectorized conversion to DenseState."""
+        sparse = SparseState(7, 4)
+        sparse[0, 0] = True
+        sparse[6, 3] = True
+        sparse[2, 1] = True
+
+        dense = sparse.to_dense()
+        assert isinstance(dense, DenseState)
+        assert (dense.width, dense.height) == (7, 4)
+        assert dense.get_live_cells() == {(0, 0), (6, 3), (2, 1)}
+        assert dense[6, 3] is True
+        assert dense[3, 2] is False
+
+    def test_to_dense_empty(self):
+        """Test converting an empty SparseState to DenseState."""
+        dense = SparseState(3, 2).to_dense()
+        assert dense.get_live_cells() == set()
+
+    def test_live_cells_in_rect(self):
+        """Test that only live cells inside the rectangle are returned."""
+        state = SparseState(10, 10)
+        for x, y in [(0, 1), (2, 2), (8, 2), (4, 5), (3, 6), (9, 9)]:
+            state[x, y] = True
+
+        xs, ys = state.live_cells_in_rect(1, 2, 8, 6)
+
+        assert set(zip(xs.tolist(), ys.tolist())) == {(2, 2), (4, 5)}
+
+    def test_live_cells_in_rect_empty(self):
+        """Test a rectangle containing no live cells."""
+        state = SparseState(10, 10)
+        state[5, 5] = True
+
+        xs, ys = state.live_cells_in_rect(0, 0, 5, 5)
+
+        assert len(xs) == len(ys) == 0
+
+    def test_live_cells_in_rect_matches_full_scan(self):
+        """Test rectangles of all shapes against filtering every live cell."""
+        rng = np.random.default_rng(7)
+        state = SparseState(40, 30)
+        for x, y in rng.integers(0, (40, 30), size=(150, 2)):
+            state[int(x), int(y)] = True
+        live = state.get_live_cells()
+
+        for x0, y0, x1, y1 in [(0, 0, 40, 30), (5, 3, 6, 29), (10, 10, 35, 12), (39, 0, 40, 30)]:
+            xs, ys = state.live_cells_in_rect(x0, y0, x1, y1)
+            expected = {(x, y) for x, y in live if x0 <= x < x1 and y0 <= y < y1}
+            assert len(xs) == len(expected)
+            assert set(zip(xs.tolist(), ys.tolist())) == expected
+
+    def test_live_cells_in_rect_past_the_grid_matches_dense(self):
+        """Test rectangles overhanging the grid against DenseState."""
+        sparse = SparseState(10, 10)
+        for x, y in [(0, 0), (9, 0), (0, 1), (9, 4), (0, 5), (6, 6), (9, 9)]:
+            sparse[x, y] = True
+        dense = sparse.to_dense()
+
+        for rect in [(-3, 0, 2, 10), (8, 0, 15, 10), (-5, -5, 15, 15), (-5, -5, -1, -1), (3, 2, 1, 8)]:
+            xs, ys = sparse.live_cells_in_rect(*rect)
+            dense_xs, dense_ys = dense.live_cells_in_rect(*rect)
+            assert set(zip(xs.tolist(), ys.tolist())) == set(
+                zip(dense_xs.tolist(), dense_ys.tolist())
+            ), rect
+
+    def test_storage_is_sorted_flat_indices(self):
+        """Test that live cells are stored as sorted y * width + x indices."""
+        state = SparseState(10, 10)
+        state[5, 6] = True
+        state[1, 2] = True
+        state[3, 4] = True
+        state[1, 2] = True  # setting twice does not duplicate
+
+        assert state._indices.dtype == np.int64
+        assert state._indices.tolist() == [21, 43, 65]
+
+    def test_buffer_grows_past_initial_capacity(self):
+        """Test that setting many cells grows the storage buffer."""
+        state = SparseState(50, 50)
+        cells = {(x, y) for y in range(0, 50, 3) for x in range(0, 50, 7)}
+        for x, y in cells:
+            state[x, y] = True
+
+        assert state.get_live_cells() == cells
+
+        for x, y in cells:
+            state[x, y] = False
+
+        assert state.get_live_cells() == set()
+        assert state[0, 0] is False
+
 
 class TestDenseState:
     """Test DenseState methods added by StateInterface."""
 
+    def test_has_no_instance_dict(self):
+        """Test that DenseState instances use __slots__ storage."""
+        assert not hasattr(DenseState(10, 10), "__dict__")
+
+    def test_storage_is_contiguous_uint8_grid(self):
+        """Test that DenseState is backed by a (height, width) uint8 array."""
+        state = DenseState(4, 3)
+        state[3, 2] = True
+
+        assert state._grid.dtype == np.uint8
+        assert state._grid.shape == (3, 4)
+        assert state._grid.flags["C_CONTIGUOUS"]
+        assert state._grid[2, 3] == 1
+
     def test_get_live_cells_empty(self):
         """Test get_live_cells returns empty set for dead grid."""
         state = DenseState(10, 10)
@@ -171,6 +293,31 @@ class TestDenseState:
         assert (4, 5) in live_cells
         assert (6, 7) in live_cells
 
+    def test_live_cells_in_rect(self):
+        """Test that only live cells inside the rectangle are returned."""
+        state = DenseState(10, 10)
+        for x, y in [(0, 1), (2, 2), (8, 2), (4, 5), (3, 6), (9, 9)]:
+            state[x, y] = True
+
+        xs, ys = state.live_cells_in_rect(1, 2, 8, 6)
+
+        assert set(zip(xs.tolist(), ys.tolist())) == {(2, 2), (4, 5)}
+
+    def test_live_cells_in_rect_past_the_grid(self):
+        """Test that a rectangle overhanging the grid does not wrap around."""
+        state = DenseState(10, 10)
+        for x, y in [(0, 0), (9, 0), (0, 9), (9, 9), (6, 6)]:
+            state[x, y] = True
+
+        xs, ys = state.live_cells_in_rect(-3, 0, 2, 10)
+        assert set(zip(xs.tolist(), ys.tolist())) == {(0, 0), (0, 9)}
+
+        xs, ys = state.live_cells_in_rect(8, 8, 15, 15)
+        assert set(zip(xs.tolist(), ys.tolist())) == {(9, 9)}
+
+        xs, ys = state.live_cells_in_rect(-5, -5, -1, -1)
+        assert len(xs) == len(ys) == 0
+
     def test_from_state_sparse_to_dense(self):
         """Test conversion from SparseState to DenseState."""
         sparse = SparseState(10, 10)
@@ -184,6 +331,20 @@ class TestDenseState:
         assert dense[7, 8] is True
         assert len(dense.get_live_cells()) == 2
 
+    def test_from_state_sparse_to_dense_subclass(self):
+        """Test that converting SparseState through a subclass returns the subclass."""
+
+        class TaggedDenseState(DenseState):
+            __slots__ = ()
+
+        sparse = SparseState(6, 4)
+        sparse[5, 3] = True
+        sparse[0, 1] = True
+
+        dense = TaggedDenseState.from_state(sparse)
+        assert type(dense) is TaggedDenseState
+        assert dense.get_live_cells() == {(5, 3), (0, 1)}
+
     def test_from_state_dense_to_dense(self):
         """Test conversion from DenseState to DenseState (copy)."""
         dense1 = DenseState(10, 10)
@@ -200,3 +361,39 @@ class TestDenseState:
         dense2[8, 9] = True
         assert dense2[8, 9] is True
         assert dense1[8, 9] is False
+
+    def test_from_state_other_state_type(self):
+        """Test conversion from a State that is neither dense nor sparse."""
+
+        class SetState(State):
+            def __init__(self, width, height):
+                self._size = (width, height)
+                self._cells = set()
+
+            width = property(lambda self: self._size[0])
+            height = property(lambda self: self._size[1])
+
+            def __getitem__(self, index):
+                return index in self._cells
+
+            def __setitem__(self, index, value):
+                self._cells.add(index)
+
+            def get_live_cells(self):
+                return set(self._cells)
+
+            @classmethod
+            def from_state(cls, other):
+                raise NotImplementedError
+
+        other = SetState(6, 4)
+        other[5, 3] = True
+        other[0, 1] = True
+
+        dense = DenseState.from_state(other)
+        assert (dense.width, dense.height) == (6, 4)
+        assert dense.get_live_cells() == {(5, 3), (0, 1)}
+
+        # The base class finds cells in a rectangle from get_live_cells
+        xs, ys = other.live_cells_in_rect(0, 0, 3, 4)
+        assert list(zip(xs.tolist(), ys.tolist())) == [(0, 1)]
@@ -81,6 +81,12 @@ class TestState:
         ):
             _ = undertest[0, 5]
 
+        # Negative coordinates must not wrap around to the far edge
+        with pytest.raises(
+            ValueError, match=r"\(-1, 2\) is outside the bounds \(5, 5\)"
+        ):
+            _ = undertest[-1, 2]
+
     def test_rectangular_grid(self):
         # Test non-square grid
         undertest = State(3, 7)
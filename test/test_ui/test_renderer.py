@@ -1,10 +1,18 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pygame
 
-from pycgol.ui._renderer import Renderer
+from pycgol.ui._renderer import Renderer, _dense_cell_positions
 from pycgol.ui._viewport_manager import ViewportManager
-from pycgol.state import DenseState as State
+from pycgol.state import DenseState as State, SparseState
+
+
+def _blitted_cells(mock_screen):
+    """(surface, position) pairs drawn by the batched live cell blit."""
+    if not mock_screen.fblits.called:
+        return []
+    mock_screen.fblits.assert_called_once()
+    return list(mock_screen.fblits.call_args.args[0])
 
 
 class TestRenderer:
@@ -16,7 +24,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(10, 10)
@@ -24,8 +32,8 @@ class TestRenderer:
 
         renderer.render(state, viewport)
 
-        # Should fill screen with dark blue (20, 30, 60)
-        mock_screen.fill.assert_called_once_with((20, 30, 60))
+        # Should first fill the whole screen with dark blue (20, 30, 60)
+        assert mock_screen.fill.call_args_list[0] == call((20, 30, 60))
 
     @patch("pycgol.ui._renderer.pygame")
     def test_render_draws_cells(self, mock_pygame):
@@ -33,7 +41,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(20, 20)
@@ -43,11 +51,10 @@ class TestRenderer:
 
         renderer.render(state, viewport)
 
-        # Should draw rectangles
         # 10x10 viewport (100/10 = 10 cells in each direction)
-        # Should draw black background for each cell + white for alive cells
-        # Total calls = background fills + alive cell fills
-        assert mock_pygame.draw.rect.call_count > 0
+        # Should draw a black background plus one tile for the alive cell
+        assert mock_screen.fill.call_count == 2
+        assert [pos for _, pos in _blitted_cells(mock_screen)] == [(50, 50)]
 
     @patch("pycgol.ui._renderer.pygame")
     def test_render_draws_alive_cell_in_white(self, mock_pygame):
@@ -55,7 +62,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(20, 20)
@@ -65,14 +72,10 @@ class TestRenderer:
 
         renderer.render(state, viewport)
 
-        # Find calls with "white" color
-        white_calls = [
-            c
-            for c in mock_pygame.draw.rect.call_args_list
-            if len(c.args) >= 2 and c.args[1] == "white"
-        ]
-
-        assert len(white_calls) > 0
+        # The cell tile is white and is blitted for the alive cell
+        cell_surface = mock_pygame.Surface.return_value
+        cell_surface.fill.assert_called_once_with(pygame.Color("white"))
+        assert _blitted_cells(mock_screen) == [(cell_surface, (50, 50))]
 
     @patch("pycgol.ui._renderer.pygame")
     def test_render_draws_black_background_for_cells(self, mock_pygame):
@@ -83,7 +86,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(20, 20)
@@ -94,27 +97,24 @@ class TestRenderer:
 
         # Find calls with "black" color
         black_calls = [
-            c
-            for c in mock_pygame.draw.rect.call_args_list
-            if len(c.args) >= 2 and c.args[1] == "black"
+            c for c in mock_screen.fill.call_args_list if c.args[0] in ("black", pygame.Color("black"))
         ]
 
-        # Should draw one black rectangle for the in-bounds area
+        # Should fill one black rectangle for the in-bounds area
         assert len(black_calls) == 1
         # Verify it covers the full viewport (10x10 cells = 100x100 pixels)
-        black_rect = black_calls[0].args[2]
+        black_rect = black_calls[0].args[1]
         assert black_rect.width == 100
         assert black_rect.height == 100
 
     @patch("pycgol.ui._renderer.pygame.display")
     @patch("pycgol.ui._renderer.pygame.font")
-    @patch("pycgol.ui._renderer.pygame.draw")
-    def test_render_with_viewport_offset(self, mock_draw, mock_font, mock_display):
+    def test_render_with_viewport_offset(self, mock_font, mock_display):
         """Test that cells are drawn correctly with viewport offset."""
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(50, 50)
@@ -127,17 +127,13 @@ class TestRenderer:
 
         # Cell (15, 15) in grid should be at viewport position (5, 5)
         # Which is screen pixel position (50, 50) with cell_size=10
-        white_calls = [
-            c
-            for c in mock_draw.rect.call_args_list
-            if len(c.args) >= 2 and c.args[1] == "white"
-        ]
+        cells = _blitted_cells(mock_screen)
 
         # Check that white cell was drawn at correct position
-        assert len(white_calls) == 1
-        drawn_rect = white_calls[0].args[2]
-        assert drawn_rect.x == 50  # (15 - 10) * 10
-        assert drawn_rect.y == 50  # (15 - 10) * 10
+        assert len(cells) == 1
+        _, (x, y) = cells[0]
+        assert x == 50  # (15 - 10) * 10
+        assert y == 50  # (15 - 10) * 10
 
     @patch("pycgol.ui._renderer.pygame")
     def test_render_skips_out_of_bounds_cells(self, mock_pygame):
@@ -148,7 +144,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         # Small grid
@@ -158,27 +154,61 @@ class TestRenderer:
 
         renderer.render(state, viewport)
 
-        # Should only draw one black rectangle for cells within grid
+        # Should only fill one black rectangle for cells within grid
         # Grid is 5x5, but viewport is 10x10
         # Black rectangle should only cover 5x5 cells = 50x50 pixels
         black_calls = [
-            c
-            for c in mock_pygame.draw.rect.call_args_list
-            if len(c.args) >= 2 and c.args[1] == "black"
+            c for c in mock_screen.fill.call_args_list if c.args[0] in ("black", pygame.Color("black"))
         ]
 
         assert len(black_calls) == 1
-        black_rect = black_calls[0].args[2]
+        black_rect = black_calls[0].args[1]
         assert black_rect.width == 50
         assert black_rect.height == 50
 
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_locks_screen_only_around_fills(self, mock_pygame):
+        """Test that the fills share one lock, released before any blit."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        state[1, 1] = True
+        viewport = ViewportManager(cell_size=10)
+
+        renderer.render(state, viewport)
+
+        calls = [name for name, _, _ in mock_screen.method_calls]
+        drawing = [n for n in calls if n in ("lock", "unlock", "fill", "fblits", "blit")]
+        assert drawing == ["lock", "fill", "fill", "unlock", "fblits", "blit"]
+
+    @patch("pycgol.ui._renderer.pygame.display")
+    @patch("pycgol.ui._renderer.pygame.font")
+    def test_render_to_real_surface(self, mock_font, mock_display):
+        """Test that blitting cells to a real surface works with the locking."""
+        screen = pygame.Surface((40, 30))
+        mock_font.SysFont.return_value.render.return_value = pygame.Surface((1, 1))
+        renderer = Renderer(screen, MagicMock())
+
+        state = State(3, 3)
+        state[1, 2] = True
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport)
+
+        assert not screen.get_locked()
+        assert screen.get_at((15, 25))[:3] == (255, 255, 255)
+        assert screen.get_at((5, 5))[:3] == (0, 0, 0)
+        assert screen.get_at((35, 5))[:3] == (20, 30, 60)
+
     @patch("pycgol.ui._renderer.pygame")
     def test_render_draws_fps_counter(self, mock_pygame):
         """Test that FPS counter is drawn."""
         mock_screen = Mock()
         mock_screen.get_width.return_value = 800
         mock_screen.get_height.return_value = 600
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         mock_font = Mock()
@@ -205,13 +235,56 @@ class TestRenderer:
         # Should blit to screen
         mock_screen.blit.assert_called_once_with(mock_font_surface, mock_font_rect)
 
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_caches_font_and_fps_text(self, mock_pygame):
+        """Test that the font is loaded once and each FPS string rendered once."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 800
+        mock_screen.get_height.return_value = 600
+        renderer = Renderer(mock_screen, MagicMock())
+        mock_font = mock_pygame.font.SysFont.return_value
+
+        state = State(10, 10)
+        viewport = ViewportManager(cell_size=10)
+
+        for fps in (60.0, 59.5, 60.0, 60.01):
+            renderer.render(state, viewport, fps=fps)
+
+        mock_pygame.font.SysFont.assert_called_once_with("monospace", 24, bold=True)
+        rendered = [c.args[0] for c in mock_font.render.call_args_list]
+        assert rendered == ["FPS:  60.0", "FPS:  59.5"]
+        assert mock_screen.blit.call_count == 4
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_reuses_fps_counter_when_fps_unchanged(self, mock_pygame):
+        """Test that an unchanged FPS counter text skips text lookup and layout."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 800
+        mock_screen.get_height.return_value = 600
+        renderer = Renderer(mock_screen, MagicMock())
+        mock_font = mock_pygame.font.SysFont.return_value
+        fps_surface = mock_font.render.return_value
+
+        state = State(10, 10)
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport, fps=60.0)
+        renderer.render(state, viewport, fps=60.01)  # displayed as 60.0 too
+
+        mock_font.render.assert_called_once()
+        fps_surface.get_rect.assert_called_once()
+        fps_rect = fps_surface.get_rect.return_value
+        assert mock_screen.blit.call_args_list == [call(fps_surface, fps_rect)] * 2
+
+        renderer.render(state, viewport, fps=30.0)
+        assert mock_font.render.call_count == 2
+
     @patch("pycgol.ui._renderer.pygame")
     def test_render_fps_counter_in_top_right(self, mock_pygame):
         """Test that FPS counter is positioned in top right corner."""
         mock_screen = Mock()
         mock_screen.get_width.return_value = 800
         mock_screen.get_height.return_value = 600
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         mock_font = Mock()
@@ -235,7 +308,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(10, 10)
@@ -252,7 +325,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(10, 10)
@@ -263,15 +336,187 @@ class TestRenderer:
         # Should flip display
         mock_pygame.display.flip.assert_called_once()
 
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_unchanged_frame_updates_nothing(self, mock_pygame):
+        """Test that a repeated frame pushes no dirty rectangles."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        state[2, 2] = True
+        viewport = ViewportManager(cell_size=10)
+
+        renderer.render(state, viewport, fps=30.0)
+        renderer.render(state, viewport, fps=30.0)
+
+        mock_pygame.display.flip.assert_called_once()
+        mock_pygame.display.update.assert_called_once_with([])
+
+    @patch("pycgol.ui._renderer.pygame.display")
+    @patch("pycgol.ui._renderer.pygame.font")
+    def test_render_updates_only_changed_cells(self, mock_font, mock_display):
+        """Test that only cells which were born or died are pushed."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        state[2, 2] = True
+        state[3, 3] = True
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport)
+
+        state[2, 2] = False
+        state[7, 1] = True
+        renderer.render(state, viewport)
+
+        dirty_rects = mock_display.update.call_args.args[0]
+        assert set(map(tuple, dirty_rects)) == {(20, 20, 10, 10), (70, 10, 10, 10)}
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_includes_fps_and_ui_rects_when_dirty(self, mock_pygame):
+        """Test that a new FPS counter and UI elements are pushed."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        mock_manager = MagicMock()
+        button = Mock()
+        mock_manager.get_sprite_group.return_value.sprites.return_value = [
+            mock_manager.get_root_container.return_value,
+            button,
+        ]
+        renderer = Renderer(mock_screen, mock_manager)
+        old_text, new_text = Mock(), Mock()
+        mock_pygame.font.SysFont.return_value.render.side_effect = [old_text, new_text]
+
+        state = State(10, 10)
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport, fps=30.0)
+        renderer.render(state, viewport, fps=31.0)
+
+        dirty_rects = mock_pygame.display.update.call_args.args[0]
+        assert old_text.get_rect.return_value in dirty_rects
+        assert new_text.get_rect.return_value in dirty_rects
+        # The button rect from both frames, but not the root container
+        assert dirty_rects.count(button.rect.copy.return_value) == 2
+        assert len(dirty_rects) == 4
+
+    @patch("pycgol.ui._renderer.pygame.display")
+    @patch("pycgol.ui._renderer.pygame.font")
+    def test_render_reuses_rect_pool(self, mock_font, mock_display):
+        """Test that dirty cell rects are reused rather than reallocated."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport)
+
+        with patch("pycgol.ui._renderer.pygame.Rect", wraps=pygame.Rect) as mock_rect:
+            state[1, 1] = True
+            renderer.render(state, viewport)
+            allocated = mock_rect.call_count
+
+            state[1, 1] = False
+            renderer.render(state, viewport)
+
+        assert allocated == 1
+        assert mock_rect.call_count == allocated
+        dirty_rects = mock_display.update.call_args.args[0]
+        assert [tuple(rect) for rect in dirty_rects] == [(10, 10, 10, 10)]
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_queries_screen_size_once(self, mock_pygame):
+        """Test that the screen size is cached rather than queried per frame."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport)
+        renderer.render(state, viewport)
+
+        assert mock_screen.get_width.call_count == 1
+        assert mock_screen.get_height.call_count == 1
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_clips_to_screen_once_per_view(self, mock_pygame):
+        """Test that the visible grid area is only recomputed when the view changes."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(20, 20)
+        viewport = ViewportManager(cell_size=10)
+
+        with patch.object(
+            Renderer, "_clip_to_screen", autospec=True, side_effect=Renderer._clip_to_screen
+        ) as mock_clip:
+            renderer.render(state, viewport)
+            renderer.render(state, viewport)
+            assert mock_clip.call_count == 1
+
+            viewport.set_viewport(5, 5)
+            renderer.render(state, viewport)
+            assert mock_clip.call_count == 2
+
+        assert renderer._visible_bounds == (5, 5, 15, 15)
+
+    @patch("pycgol.ui._renderer.pygame.display")
+    @patch("pycgol.ui._renderer.pygame.font")
+    def test_render_coalesces_many_dirty_rects(self, mock_font, mock_display):
+        """Test that many changed cells are pushed as one bounding rect."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 200
+        mock_screen.get_height.return_value = 200
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(20, 20)
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport)
+
+        # 100 changed cells in columns 2..11, rows 5..14
+        for x in range(2, 12):
+            for y in range(5, 15):
+                state[x, y] = True
+        renderer.render(state, viewport)
+
+        dirty_rects = mock_display.update.call_args.args[0]
+        assert [tuple(rect) for rect in dirty_rects] == [(20, 50, 100, 100)]
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_flips_when_viewport_moves(self, mock_pygame):
+        """Test that panning or zooming redraws the whole display."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(20, 20)
+        viewport = ViewportManager(cell_size=10)
+        renderer.render(state, viewport)
+        viewport.set_viewport(1, 0)
+        renderer.render(state, viewport)
+
+        assert mock_pygame.display.flip.call_count == 2
+        mock_pygame.display.update.assert_not_called()
+
     @patch("pycgol.ui._renderer.pygame.display")
     @patch("pycgol.ui._renderer.pygame.font")
-    @patch("pycgol.ui._renderer.pygame.draw")
-    def test_render_with_different_cell_sizes(self, mock_draw, mock_font, mock_display):
+    def test_render_with_different_cell_sizes(self, mock_font, mock_display):
         """Test rendering with different cell sizes."""
         mock_screen = Mock()
         mock_screen.get_width.return_value = 200
         mock_screen.get_height.return_value = 200
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(50, 50)
@@ -283,17 +528,13 @@ class TestRenderer:
 
         renderer.render(state, viewport)
 
-        # Find white cell draw call
-        white_calls = [
-            c
-            for c in mock_draw.rect.call_args_list
-            if len(c.args) >= 2 and c.args[1] == "white"
-        ]
+        # Find white cell tile
+        cells = _blitted_cells(mock_screen)
 
-        assert len(white_calls) == 1
-        drawn_rect = white_calls[0].args[2]
-        assert drawn_rect.width == 20
-        assert drawn_rect.height == 20
+        assert len(cells) == 1
+        cell_surface, position = cells[0]
+        assert cell_surface.get_size() == (20, 20)
+        assert position == (100, 100)
 
     @patch("pycgol.ui._renderer.pygame")
     def test_render_default_fps_is_zero(self, mock_pygame):
@@ -301,7 +542,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         mock_font = Mock()
@@ -327,7 +568,7 @@ class TestRenderer:
         mock_screen = Mock()
         mock_screen.get_width.return_value = 100
         mock_screen.get_height.return_value = 100
-        mock_manager = Mock()
+        mock_manager = MagicMock()
         renderer = Renderer(mock_screen, mock_manager)
 
         state = State(20, 20)
@@ -340,11 +581,212 @@ class TestRenderer:
 
         renderer.render(state, viewport)
 
-        # Should draw 3 white cells
-        white_calls = [
-            c
-            for c in mock_pygame.draw.rect.call_args_list
-            if len(c.args) >= 2 and c.args[1] == "white"
+        # Should draw 3 white cells in one batch
+        positions = {pos for _, pos in _blitted_cells(mock_screen)}
+        assert positions == {(20, 20), (30, 30), (40, 40)}
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_skips_blit_without_visible_cells(self, mock_pygame):
+        """Test that no batch is drawn when no live cell is on screen."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(50, 50)
+        state[40, 40] = True  # outside the 10x10 viewport
+
+        renderer.render(state, ViewportManager(cell_size=10))
+
+        mock_screen.fblits.assert_not_called()
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_with_negative_viewport_offset(self, mock_pygame):
+        """Test that cells are placed correctly when the grid starts mid-screen."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(20, 20)
+        state[0, 0] = True
+        state[6, 1] = True  # off the right edge of the screen
+
+        viewport = ViewportManager(cell_size=10)
+        viewport.set_viewport(-4, -2)
+
+        renderer.render(state, viewport)
+
+        assert [pos for _, pos in _blitted_cells(mock_screen)] == [(40, 20)]
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_sparse_state(self, mock_pygame):
+        """Test that non-dense states are drawn from their live cells."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = SparseState(50, 50)
+        state[12, 13] = True
+        state[30, 30] = True  # outside the viewport
+
+        viewport = ViewportManager(cell_size=10)
+        viewport.set_viewport(10, 10)
+
+        renderer.render(state, viewport)
+
+        assert [pos for _, pos in _blitted_cells(mock_screen)] == [(20, 30)]
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_culls_viewport_entirely_off_grid(self, mock_pygame):
+        """Test that nothing is scanned or drawn when the grid is off screen."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(5, 5)
+        state[4, 4] = True
+        viewport = ViewportManager(cell_size=10)
+        viewport.set_viewport(20, 0)
+
+        with patch.object(Renderer, "_cell_positions") as mock_scan:
+            renderer.render(state, viewport)
+
+        mock_scan.assert_not_called()
+        mock_screen.fill.assert_called_once_with((20, 30, 60))
+        mock_screen.fblits.assert_not_called()
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_culls_to_grid_edges(self, mock_pygame):
+        """Test that a grid smaller than the viewport only yields on-grid cells."""
+        mock_pygame.Rect = pygame.Rect
+
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(5, 5)
+        for x, y in [(0, 0), (4, 0), (0, 4), (4, 4)]:
+            state[x, y] = True
+        viewport = ViewportManager(cell_size=10)
+        viewport.set_viewport(-2, 0)
+
+        renderer.render(state, viewport)
+
+        black_rect = mock_screen.fill.call_args_list[1].args[1]
+        assert (black_rect.x, black_rect.y) == (20, 0)
+        assert (black_rect.width, black_rect.height) == (50, 50)
+
+        positions = {pos for _, pos in _blitted_cells(mock_screen)}
+        assert positions == {(20, 0), (60, 0), (20, 40), (60, 40)}
+
+    @patch("pycgol.ui._renderer._NUMBA_AVAILABLE", False)
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_without_numba(self, mock_pygame):
+        """Test that dense states fall back to the NumPy scan without numba."""
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(20, 20)
+        state[3, 4] = True
+        state[15, 4] = True  # outside the viewport
+        viewport = ViewportManager(cell_size=10)
+        viewport.set_viewport(1, 2)
+
+        renderer.render(state, viewport)
+
+        assert [pos for _, pos in _blitted_cells(mock_screen)] == [(20, 20)]
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_small_cells_writes_pixels(self, mock_pygame):
+        """Test that small dense cells are drawn with one pixel array blit."""
+        mock_pygame.Rect = pygame.Rect
+
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        state[3, 1] = True
+        viewport = ViewportManager(cell_size=2)
+
+        renderer.render(state, viewport)
+
+        mock_screen.fblits.assert_not_called()
+        mock_screen.subsurface.assert_called_once_with(pygame.Rect(0, 0, 20, 20))
+        target, pixels = mock_pygame.surfarray.blit_array.call_args.args
+        assert target is mock_screen.subsurface.return_value
+        assert pixels.shape == (20, 20, 3)
+        assert pixels[6:8, 2:4].min() == 255
+        assert pixels.sum() == 4 * 3 * 255
+
+    @patch("pycgol.ui._renderer.pygame")
+    def test_render_small_cells_dirty_rects(self, mock_pygame):
+        """Test that the pixel path pushes the grid area only when cells change."""
+        mock_pygame.Rect = pygame.Rect
+
+        mock_screen = Mock()
+        mock_screen.get_width.return_value = 100
+        mock_screen.get_height.return_value = 100
+        renderer = Renderer(mock_screen, MagicMock())
+
+        state = State(10, 10)
+        viewport = ViewportManager(cell_size=2)
+        renderer.render(state, viewport)
+        renderer.render(state, viewport)
+        mock_pygame.display.update.assert_called_once_with([])
+
+        state[5, 5] = True
+        renderer.render(state, viewport)
+        assert mock_pygame.display.update.call_args.args[0] == [
+            pygame.Rect(0, 0, 20, 20)
         ]
 
-        assert len(white_calls) == 3
+    @patch("pycgol.ui._renderer.pygame.display")
+    @patch("pycgol.ui._renderer.pygame.font")
+    def test_render_small_cells_to_real_surface(self, mock_font, mock_display):
+        """Test the pixels the pixel path actually produces."""
+        screen = pygame.Surface((40, 30))
+        mock_font.SysFont.return_value.render.return_value = pygame.Surface((1, 1))
+        renderer = Renderer(screen, MagicMock())
+
+        state = State(10, 10)
+        state[1, 2] = True
+        viewport = ViewportManager(cell_size=2)
+        viewport.set_viewport(0, 0)
+        renderer.render(state, viewport)
+
+        assert screen.get_at((2, 4))[:3] == (255, 255, 255)
+        assert screen.get_at((3, 5))[:3] == (255, 255, 255)
+        assert screen.get_at((4, 4))[:3] == (0, 0, 0)
+        assert screen.get_at((19, 19))[:3] == (0, 0, 0)
+        # Beyond the 10x10 grid is out-of-bounds background
+        assert screen.get_at((25, 5))[:3] == (20, 30, 60)
+
+
+class TestDenseCellPositions:
+    """Test the compiled live cell position helper."""
+
+    def test_matches_live_cells_in_rect(self):
+        """Test that it agrees with the NumPy scan, in screen space."""
+        state = State(12, 9)
+        for x, y in [(0, 0), (2, 3), (5, 3), (11, 8), (6, 1)]:
+            state[x, y] = True
+
+        positions = _dense_cell_positions(state._grid, 1, 1, 7, 6, -2, 1, 4)
+
+        xs, ys = state.live_cells_in_rect(1, 1, 7, 6)
+        expected = {((x + 2) * 4, (y - 1) * 4) for x, y in zip(xs.tolist(), ys.tolist())}
+        assert positions.shape == (3, 2)
+        assert set(map(tuple, positions.tolist())) == expected
+
+    def test_empty_rectangle(self):
+        """Test that no live cells gives an empty (0, 2) array."""
+        positions = _dense_cell_positions(State(4, 4)._grid, 0, 0, 4, 4, 0, 0, 10)
+        assert positions.shape == (0, 2)
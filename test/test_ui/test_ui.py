@@ -1,9 +1,23 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+import pygame
+import pytest
 
 from pycgol.ui._ui import UI
+from pycgol.ui._viewport_manager import ViewportManager
 from pycgol.state import DenseState
 
 
+@pytest.fixture
+def dummy_display(monkeypatch):
+    """A real pygame display on SDL's dummy video driver, so pixels can be read back."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.display.quit()
+
+
 class TestUI:
     """Test the UI facade - it should delegate to its components."""
 
@@ -109,6 +123,20 @@ class TestUI:
 
         mock_viewport.end_drag.assert_called_once()
 
+    @patch("pycgol.ui._ui.pygame")
+    def test_forwarding_methods_are_bound_component_methods(self, mock_pygame):
+        """Test that pure delegates call the components without a UI wrapper."""
+        mock_pygame.display.set_mode.return_value = Mock()
+        viewport = ViewportManager(10)
+        mock_components = Mock()
+
+        ui = UI(800, 600, Mock(), viewport=viewport, components=mock_components)
+
+        assert ui.start_drag == viewport.start_drag
+        assert ui.end_drag == viewport.end_drag
+        assert ui.has_help_popup is mock_components.has_help_popup
+        assert ui.is_pause_button is mock_components.is_pause_button
+
     @patch("pycgol.ui._ui.pygame")
     def test_zoom_delegates(self, mock_pygame):
         """Test that zoom delegates to ViewportManager."""
@@ -180,9 +208,9 @@ class TestUI:
         mock_components = Mock()
 
         ui = UI(800, 600, Mock(), cell_size=10, components=mock_components)
-        ui.show_help_popup()
+        ui.show_help_popup(["numpy", "loop"])
 
-        mock_components.show_help_popup.assert_called_once()
+        mock_components.show_help_popup.assert_called_once_with(["numpy", "loop"])
 
     @patch("pycgol.ui._ui.pygame")
     def test_render_delegates(self, mock_pygame):
@@ -204,3 +232,72 @@ class TestUI:
         ui.render(state, fps=60.0)
 
         mock_renderer.render.assert_called_once_with(state, mock_viewport, 60.0)
+
+
+@pytest.mark.usefixtures("dummy_display")
+class TestUIRendering:
+    """Test what UI.render actually puts on screen, pixel by pixel.
+
+    These check the drawn result rather than the drawing calls, so the
+    renderer is free to batch or skip work however it likes.
+    """
+
+    BACKGROUND = (20, 30, 60)
+    BLACK = (0, 0, 0)
+    WHITE = (255, 255, 255)
+
+    def _render(self, state, cell_size=10):
+        """Render state through a real UI on a 300x200 screen and return the screen."""
+        ui = UI(300, 200, MagicMock(), cell_size=cell_size, components=Mock())
+        ui.set_viewport(0, 0)
+        ui.render(state)
+        return pygame.display.get_surface()
+
+    def _colour(self, screen, x, y):
+        return tuple(screen.get_at((x, y)))[:3]
+
+    def test_render_cell_colors(self):
+        """Test that live cells are white, dead cells black, off-grid blue."""
+        state = DenseState(4, 3)
+        state[1, 1] = True
+
+        screen = self._render(state)
+
+        assert self._colour(screen, 15, 15) == self.WHITE
+        for x, y in [(0, 0), (3, 0), (0, 2), (3, 2), (2, 1)]:
+            assert self._colour(screen, x * 10 + 5, y * 10 + 5) == self.BLACK
+        assert self._colour(screen, 45, 15) == self.BACKGROUND
+        assert self._colour(screen, 15, 35) == self.BACKGROUND
+
+    def test_render_rectangle_dimensions(self):
+        """Test that a live cell covers exactly its cell_size square."""
+        state = DenseState(4, 3)
+        state[1, 1] = True
+
+        screen = self._render(state)
+
+        for x, y in [(10, 10), (19, 10), (10, 19), (19, 19)]:
+            assert self._colour(screen, x, y) == self.WHITE
+        for x, y in [(9, 10), (20, 10), (10, 9), (10, 20)]:
+            assert self._colour(screen, x, y) == self.BLACK
+
+    def test_render_empty_state(self):
+        """Test that an empty grid is all black."""
+        screen = self._render(DenseState(4, 3))
+
+        grid = pygame.surfarray.pixels3d(screen)[:40, :30]
+        assert (grid == 0).all()
+        del grid
+
+    def test_render_small_cells(self):
+        """Test that small cells come out the same as large ones."""
+        state = DenseState(4, 3)
+        state[1, 1] = True
+        state[3, 2] = True
+
+        screen = self._render(state, cell_size=2)
+
+        assert self._colour(screen, 2, 2) == self.WHITE
+        assert self._colour(screen, 7, 5) == self.WHITE
+        assert self._colour(screen, 4, 2) == self.BLACK
+        assert self._colour(screen, 8, 2) == self.BACKGROUND